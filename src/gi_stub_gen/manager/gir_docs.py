@@ -20,6 +20,8 @@ class GIRDocs(metaclass=SingletonMeta):
     def __init__(self) -> None:
         self._gir_path: Path | None = None
         self._module_gir_docs: ModuleDocs | None = None
+        self._translated_docs: dict[str, str] = {}
+        """cache of the translated docstrings keyed by their raw text"""
 
     @classmethod
     def reset(cls) -> None:
@@ -49,11 +51,15 @@ class GIRDocs(metaclass=SingletonMeta):
 
         self._gir_path = gir_path
         self._module_gir_docs = docs
+        # translations depend on the module namespace
+        self._translated_docs = {}
         return True
 
     def translate_c_doc_to_python(self, raw_text: str | None) -> str:
         """
         Translate a C/GObject style docstring to a Python-friendly format.
+        Translations are cached since the same docs are requested several times
+        (i.e. a class field both from GI info and from the class attributes).
         """
         from gi_stub_gen.utils.gir_docs import translate_docstring
 
@@ -61,7 +67,14 @@ class GIRDocs(metaclass=SingletonMeta):
             # logger.warning("GIR docs not loaded, please load a GIR file first using GIRDocs.load()")
             return ""
 
-        return translate_docstring(raw_text, self._module_gir_docs.module_namespace, repo=GIRepo())
+        if not raw_text:
+            return ""
+
+        translated = self._translated_docs.get(raw_text)
+        if translated is None:
+            translated = translate_docstring(raw_text, self._module_gir_docs.module_namespace, repo=GIRepo())
+            self._translated_docs[raw_text] = translated
+        return translated
 
     def get_constant_docs(self, constant_name: str) -> str | None:
         """
@@ -161,6 +174,17 @@ class GIRDocs(metaclass=SingletonMeta):
 
         return None
 
+    def get_class_fields_docs(self, class_name: str) -> dict[str, str]:
+        """
+        Get the raw (not translated) documentation of all the fields of a class, keyed by field name.
+        Lets callers parsing many fields of the same class resolve the class once.
+        """
+        if not self._module_gir_docs:
+            return {}
+
+        class_docs = self._module_gir_docs.classes.get(class_name)
+        return class_docs.fields if class_docs else {}
+
     def get_class_method_docstring(
         self,
         class_name: str,
@@ -233,6 +257,17 @@ class GIRDocs(metaclass=SingletonMeta):
             return self.translate_c_doc_to_python(docstring)
         return None
 
+    def get_enum_fields_docs(self, enum_name: str) -> dict[str, str]:
+        """
+        Get the raw (not translated) documentation of all the fields of an enum/flag, keyed by field name.
+        Lets callers parsing every value of the same enum resolve it once.
+        """
+        if not self._module_gir_docs:
+            return {}
+
+        enum_docs = self._module_gir_docs.enums.get(enum_name)
+        return enum_docs.fields if enum_docs else {}
+
     def get_enum_field_docstring(
         self,
         enum_name: str,
@@ -73,6 +73,17 @@ These are usually discovered while parsing other elements. If we never encounter
 we can add them here to ensure they are present in the stubs."""
 
 
+def has_class_overrides(
+    namespace: str,
+    class_name: str,
+) -> bool:
+    """
+    Check if there are manual overrides (methods or fields) for a class.
+    Most classes have none, so the callers can skip applying them.
+    """
+    return class_name in CLASS_OVERRIDES.get(namespace, {})
+
+
 def apply_method_overrides(
     current_methods: list[FunctionSchema],
     namespace: str,
@@ -110,6 +121,18 @@ def apply_method_overrides(
     return new_methods
 
 
+def get_field_overrides(
+    namespace: str,
+    class_name: str,
+) -> dict[str, ClassFieldSchema | None]:
+    """
+    Get the manual field overrides for a class, empty if there are none.
+    Overridden fields are replaced (or removed if mapped to None) by apply_field_overrides,
+    so there is no need to parse them from GI.
+    """
+    return CLASS_OVERRIDES.get(namespace, {}).get(class_name, {}).get("fields", {})
+
+
 def apply_field_overrides(
     current_fields: list[ClassFieldSchema],
     namespace: str,
@@ -121,7 +144,7 @@ def apply_field_overrides(
     or add new fields that are not present in the GIR (e.g. Python-only attributes).
     """
     # Retrieve the specific field overrides for this class from the global config
-    overrides = CLASS_OVERRIDES.get(namespace, {}).get(class_name, {}).get("fields", {})
+    overrides = get_field_overrides(namespace, class_name)
 
     if not overrides:
         return current_fields
@@ -1,11 +1,12 @@
 from __future__ import annotations
-import importlib
+import functools
 
 import gi
 import gi._gi as GI  # type: ignore
-from gi.repository import GObject
+from gi.repository import GIRepository, GObject
 
 from typing import Any
+from operator import attrgetter, itemgetter
 from types import (
     BuiltinFunctionType,
     FunctionType,
@@ -19,12 +20,18 @@ from gi_stub_gen.parser.fields import gi_parse_field, should_expose_class_field
 from gi_stub_gen.parser.signals import get_all_signals_flattened
 from gi_stub_gen.utils.gi_utils import (
     MAP_GI_GTYPE_TO_TYPE,
+    get_gi_interface_py_type,
     get_gi_type_info,
     gi_type_to_py_type,
     is_class_field_nullable,
 )
 from gi_stub_gen.manager.gir_docs import GIRDocs
-from gi_stub_gen.overrides import apply_field_overrides, apply_method_overrides
+from gi_stub_gen.overrides import (
+    apply_field_overrides,
+    apply_method_overrides,
+    get_field_overrides,
+    has_class_overrides,
+)
 
 from gi_stub_gen.parser.python_function import parse_python_function
 from gi_stub_gen.parser.constant import parse_constant
@@ -32,10 +39,11 @@ from gi_stub_gen.parser.function import parse_function
 
 
 from gi_stub_gen.schema.builtin_function import BuiltinFunctionSchema
-from gi_stub_gen.schema.class_ import ClassFieldSchema, ClassSchema
+from gi_stub_gen.schema.class_ import ClassFieldSchema, ClassPropSchema, ClassSchema
 from gi_stub_gen.schema.function import (
     CallbackSchema,
     FunctionArgumentSchema,
+    FunctionSchema,
 )
 from gi_stub_gen.schema.signals import (
     SignalSchema,
@@ -43,18 +51,64 @@ from gi_stub_gen.schema.signals import (
 )
 from gi_stub_gen.utils.gst import get_fraction_value
 from gi_stub_gen.utils.utils import (
+    get_module_name_last_part,
     get_py_type_name_repr,
     get_py_type_namespace_repr,
     sanitize_variable_name,
 )
-from gi.repository import GIRepository
-
-from gi_stub_gen.schema.function import FunctionSchema
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# getattr default for attributes that can not be resolved (cheaper than try/except AttributeError)
+_MISSING = object()
+
+# sort key for schemas/ParamSpecs (C implemented, cheaper than a lambda)
+_by_name = attrgetter("name")
+
+# python attribute types (found in the class __dict__) parsed as python functions
+_PYTHON_FUNCTION_TYPES = frozenset({MethodType, FunctionType, BuiltinFunctionType})
+
+# only instances of these types can be parsed by parse_constant:
+# enums/flags (GEnum/GFlags, IntEnum/IntFlag) and bool are int subclasses.
+# Used as a cheap precheck to skip parse_constant (and the docstring lookup) for
+# methods and descriptors, which are the majority of the class attributes
+_CONSTANT_CANDIDATE_TYPES = (int, str, float, dict, tuple, list, GObject.GType)
+
+# python attribute types we do not parse, only reported in the class debug info
+_EXTRA_ATTRIBUTE_LABELS: dict[type, str] = {
+    MethodDescriptorType: "method_descriptor",
+    property: "property",
+}
+
+# prepended to the docstring of python methods overriding a gi method
+_IS_OVERRIDE_NOTE = "[is-override: Note this method is an override in Python of the original gi implementation.]"
+
+# resolved once instead of walking the attribute chains for every property
+_PARAM_READABLE = GObject.ParamFlags.READABLE
+_PARAM_WRITABLE = GObject.ParamFlags.WRITABLE
+_PARAM_DEPRECATED = GObject.ParamFlags.DEPRECATED
+# properties that can be set in the constructor
+_PARAM_INIT_SETTABLE = GObject.ParamFlags.WRITABLE | GObject.ParamFlags.CONSTRUCT | GObject.ParamFlags.CONSTRUCT_ONLY
+
+# same for the signal flags, read for every signal
+_SIGNAL_RUN_FIRST = GObject.SignalFlags.RUN_FIRST
+_SIGNAL_RUN_LAST = GObject.SignalFlags.RUN_LAST
+_SIGNAL_RUN_CLEANUP = GObject.SignalFlags.RUN_CLEANUP
+_SIGNAL_NO_RECURSE = GObject.SignalFlags.NO_RECURSE
+_SIGNAL_DETAILED = GObject.SignalFlags.DETAILED
+_SIGNAL_ACTION = GObject.SignalFlags.ACTION
+_SIGNAL_NO_HOOKS = GObject.SignalFlags.NO_HOOKS
+_SIGNAL_MUST_COLLECT = GObject.SignalFlags.MUST_COLLECT
+_SIGNAL_DEPRECATED = GObject.SignalFlags.DEPRECATED
+
+# base classes of the enum/flags property types (defaults rendered as members)
+_ENUM_FLAGS_TYPES = (GObject.GEnum, GObject.GFlags)
+
+# metaclasses of the objects parse_class can handle
+_CLASS_METATYPES = (gi.types.GObjectMeta, gi.types.StructMeta, type)  # type: ignore
+
 
 def is_local(py_class: type, method_name: str) -> bool:
     """
@@ -71,7 +125,7 @@ def get_all_properties_flattened(
     - Properties defined in implemented interfaces
     - Properties defined in parent classes (up to GObject)
 
-    Uses duck typing (hasattr) to safely handle both Objects and Interfaces.
+    Uses duck typing (getattr with a None default) to safely handle both Objects and Interfaces.
     """
     # Dictionary to ensure uniqueness and prefer the most specific definition (Child > Parent)
     collected_props: dict[str, GIRepository.PropertyInfo] = {}
@@ -80,25 +134,25 @@ def get_all_properties_flattened(
 
     while current is not None:
         # 1. Collect properties defined directly on the current element
-        if hasattr(current, "get_properties"):
-            for prop in current.get_properties():  # type: ignore
+        if get_properties := getattr(current, "get_properties", None):
+            for prop in get_properties():
                 name = prop.get_name()
                 if name not in collected_props:
                     collected_props[name] = prop
 
         # 2. Collect properties from implemented interfaces
         #    (Interfaces can define properties too, e.g., Gtk.Editable defined 'cursor-position')
-        if hasattr(current, "get_interfaces"):
-            for iface in current.get_interfaces():  # type: ignore
-                if hasattr(iface, "get_properties"):
-                    for prop in iface.get_properties():
+        if get_interfaces := getattr(current, "get_interfaces", None):
+            for iface in get_interfaces():
+                if get_iface_properties := getattr(iface, "get_properties", None):
+                    for prop in get_iface_properties():
                         name = prop.get_name()
                         if name not in collected_props:
                             collected_props[name] = prop
 
         # 3. Move up to the parent class
-        if hasattr(current, "get_parent"):
-            current = current.get_parent()  # type: ignore
+        if get_parent := getattr(current, "get_parent", None):
+            current = get_parent()
         else:
             # Reached GObject or inside an Interface/Struct
             current = None
@@ -106,6 +160,83 @@ def get_all_properties_flattened(
     return list(collected_props.values())
 
 
+def add_found_callback(
+    callbacks_found: dict[str, CallbackSchema],
+    callback: CallbackSchema,
+) -> None:
+    """
+    Add a callback to the callbacks found so far, keyed by its name.
+    If a callback with the same name was already found, its originated_from
+    info is merged instead of storing a duplicate.
+
+    Args:
+        callbacks_found (dict[str, CallbackSchema]): callbacks found so far
+        callback (CallbackSchema): newly found callback
+    """
+    existing_cb = callbacks_found.get(callback.name)
+    if existing_cb is None:
+        callbacks_found[callback.name] = callback
+        return
+
+    if callback.originated_from:
+        if existing_cb.originated_from is None:
+            existing_cb.originated_from = set(callback.originated_from)
+        else:
+            existing_cb.originated_from.update(callback.originated_from)
+
+
+def is_field_overridden(
+    field_overrides: dict[str, ClassFieldSchema | None],
+    field_name: str,
+) -> bool:
+    """
+    Check if a field is replaced/removed by a manual override.
+    In that case its parsed schema would be discarded by apply_field_overrides.
+    """
+    # overrides are keyed by the sanitized field name (i.e. the name in the schema)
+    return bool(field_overrides) and sanitize_variable_name(field_name)[0] in field_overrides
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_gtype_pytype(namespace: str, gtype: GObject.GType) -> Any:
+    """
+    Resolve the python type of a GType whose pytype is not set (not registered yet).
+    The same gtypes appear in the properties of many classes, and types that can not
+    be resolved would otherwise go through the whole lookup again for every property,
+    so results (None included) are memoized.
+
+    Args:
+        namespace (str): namespace of the class being parsed, used to guess the GIR name
+        gtype (GObject.GType): gtype of the property value
+
+    Returns:
+        the python type, or None if it can not be resolved
+    """
+    # TODO: find by name?
+    # Gtk.PrintBackend non viene trovato
+    # maybe it does not work beacuse it is not loaded yet?
+    info = GIRepo().raw.find_by_gtype(gtype)
+    if not info:
+        # we try  via find_by_name guessing the name
+        # eg. Gtk.PrintBackend has no gtype registered but it exists in the GIR
+        c_name = gtype.name  # Es: "GtkPrintBackend"
+        if not (c_name and c_name.startswith(namespace)):
+            return None
+        info = GIRepo().find_by_name(namespace, c_name[len(namespace) :])
+        if not info:
+            return None
+
+    gi_ns = info.get_namespace()  # es. "Gtk"
+    gi_name = info.get_name()  # es. "Application"
+    if gi_ns is None or gi_name is None:
+        return None
+    try:
+        # this works and let pygobject register the wrapper and set gtype.pytype
+        return get_gi_interface_py_type(gi_ns, gi_name)
+    except (ImportError, AttributeError):
+        return None
+
+
 def create_init_method(namespace: str, real_cls: Any) -> FunctionSchema | None:
     """
     Create an __init__ stub by inspecting the real Python class via PyGObject.
@@ -132,27 +263,28 @@ def create_init_method(namespace: str, real_cls: Any) -> FunctionSchema | None:
 
     seen_props = set()
     prop_spec: GObject.ParamSpec
-    for prop_spec in sorted(props, key=lambda x: x.name):
-        name = prop_spec.name  # Es: "secondary-icon-name"
-        logger.debug(f"# Property: {name}")
+    # sorted by name for a deterministic output: each name is read once
+    # and kept next to its ParamSpec, so the loop does not read it again
+    named_props = sorted(((p.name, p) for p in props), key=itemgetter(0))
+    for name, prop_spec in named_props:
+        # name Es: "secondary-icon-name"
+        logger.debug("# Property: %s", name)
 
         if name in seen_props:
-            logger.debug(f"  - {name} skipping duplicate property")
+            logger.debug("  - %s skipping duplicate property", name)
             continue
         seen_props.add(name)
 
         # Controlliamo i Flags: ci interessano WRITABLE o CONSTRUCT
         flags = prop_spec.flags
-        assert flags is not None, "ParamSpec flags is None"
+        if flags is None:
+            logger.warning("  - %s skipping property without ParamSpec flags", name)
+            continue
         # GObject.ParamFlags.WRITABLE = 2, CONSTRUCT = 4, CONSTRUCT_ONLY = 8
-        is_writable = (
-            (flags & GObject.ParamFlags.WRITABLE)
-            or (flags & GObject.ParamFlags.CONSTRUCT)
-            or (flags & GObject.ParamFlags.CONSTRUCT_ONLY)
-        )
-        is_deprecated = bool(flags & GObject.ParamFlags.DEPRECATED)
+        is_writable = flags & _PARAM_INIT_SETTABLE
+        is_deprecated = bool(flags & _PARAM_DEPRECATED)
         if not is_writable:
-            logger.debug(f"  - {name} skipping non-writable/non-construct property")
+            logger.debug("  - %s skipping non-writable/non-construct property", name)
             continue
 
         sane_arg_name, line_comment = sanitize_variable_name(name)
@@ -168,50 +300,21 @@ def create_init_method(namespace: str, real_cls: Any) -> FunctionSchema | None:
         pytype = gtype.pytype
 
         if pytype is None:
-            # TODO: find by name?
-            # Gtk.PrintBackend non viene trovato
-            # maybe it does not work beacuse it is not loaded yet?
-            info = GIRepo().raw.find_by_gtype(gtype)
-            if info:
-                gi_ns = info.get_namespace()  # es. "Gtk"
-                gi_name = info.get_name()  # es. "Application"
-                assert gi_ns is not None and gi_name is not None
-                try:
-                    module = importlib.import_module(f"gi.repository.{gi_ns}")
-
-                    # this works and let pygobject register the wrapper and set gtype.pytype
-                    pytype = getattr(module, gi_name)
-                    # now gtype.pytype should be set
-                    # pytype = gtype.pytype
-
-                except (ImportError, AttributeError):
-                    pass
-            else:
-                # we try  via find_by_name guessing the name
-                # eg. Gtk.PrintBackend has no gtype registered but it exists in the GIR
-                c_name = gtype.name  # Es: "GtkPrintBackend"
-                if c_name and c_name.startswith(namespace):
-                    guessed_name = c_name[len(namespace) :]
-                    info_by_name = GIRepo().find_by_name(namespace, guessed_name)
-                    if info_by_name:
-                        gi_ns = info_by_name.get_namespace()  # es. "Gtk"
-                        gi_name = info_by_name.get_name()  # es. "Application"
-                        assert gi_ns is not None and gi_name is not None
-                        try:
-                            module = importlib.import_module(f"gi.repository.{gi_ns}")
-                            pytype = getattr(module, gi_name)
-                        except (ImportError, AttributeError):
-                            pass
+            # not registered yet: resolve it from the GIR (cached by gtype)
+            pytype = resolve_gtype_pytype(namespace, gtype)
 
         if pytype is None:
             # pass from here only if we fail to load the type
             default_value_repr = "None"
-            if gtype not in MAP_GI_GTYPE_TO_TYPE:
-                breakpoint()
-                assert False, f"Unknown gtype with no pytype in ParamSpec: {gtype}: {gtype.name}"
             pytype = MAP_GI_GTYPE_TO_TYPE.get(gtype, None)
-            py_type_hint_name = get_py_type_name_repr(pytype)
-            py_type_hint_namespace = get_py_type_namespace_repr(pytype)
+            if pytype is None:
+                # unknown gtype: keep generating the stub, typed as Any
+                logger.error("Unknown gtype with no pytype in ParamSpec: %s (%s)", gtype, gtype.name)
+                py_type_hint_name = "Any"
+                py_type_hint_namespace = "typing"
+            else:
+                py_type_hint_name = get_py_type_name_repr(pytype)
+                py_type_hint_namespace = get_py_type_namespace_repr(pytype)
 
         else:
             if pytype is GObject.ValueArray:
@@ -221,13 +324,14 @@ def create_init_method(namespace: str, real_cls: Any) -> FunctionSchema | None:
                 py_type_hint_name = pytype.__name__
                 py_type_hint_namespace = get_py_type_namespace_repr(pytype)
 
-            elif issubclass(pytype, (GObject.GEnum, GObject.GFlags)):
+            elif issubclass(pytype, _ENUM_FLAGS_TYPES):
                 # Enum/Flag type
                 py_type_hint_name = pytype.__name__
                 py_type_hint_namespace = get_py_type_namespace_repr(pytype)
 
+                # read once: each call goes through GObject
                 default_value = prop_spec.get_default_value()
-                default_value_repr = repr(prop_spec.get_default_value())
+                default_value_repr = repr(default_value)
                 # Enums/Flags: usiamo il nome dell'enum/flag come default
                 # default_value = f"{py_type_hint_namespace}.{py_type_hint_name}({default_value})"
                 try:
@@ -242,8 +346,11 @@ def create_init_method(namespace: str, real_cls: Any) -> FunctionSchema | None:
                             if py_type_hint_namespace and py_type_hint_namespace != namespace
                             else ""
                         )
+                        # flag member names have no spaces: drop them all at once
+                        # instead of stripping every part
+                        flags_prefix = f"{ns}{py_type_hint_name}."
                         default_value_repr = " | ".join(
-                            f"{ns}{py_type_hint_name}.{part.strip()}" for part in actual_default.name.split("|")
+                            [flags_prefix + part for part in actual_default.name.replace(" ", "").split("|")]
                         )
 
                     else:
@@ -252,22 +359,24 @@ def create_init_method(namespace: str, real_cls: Any) -> FunctionSchema | None:
                             default_value_repr = f"{py_type_hint_namespace}.{default_value_repr}"
                 except Exception:
                     # fallback: usiamo il valore numerico
-                    default_value_repr = repr(prop_spec.get_default_value())
+                    default_value_repr = repr(default_value)
             else:
                 # regular type
                 py_type_hint_name = get_py_type_name_repr(pytype)
                 py_type_hint_namespace = get_py_type_namespace_repr(pytype)
                 try:
                     # check if its a fraction
-                    default_value_repr = get_fraction_value(prop_spec.get_default_value())
+                    default_value = prop_spec.get_default_value()
+                    default_value_repr = get_fraction_value(default_value)
                     if not default_value_repr:
-                        default_value_repr = repr(prop_spec.get_default_value())
+                        default_value_repr = repr(default_value)
                 except TypeError:
                     default_value_repr = "None" if is_class_field_nullable(prop_spec) else "..."
-                    # breakpoint()
 
+        # every value is computed above with the right type:
+        # skip pydantic validation, this runs once per writable property
         args.append(
-            FunctionArgumentSchema(
+            FunctionArgumentSchema.model_construct(
                 direction="IN",
                 name=sane_arg_name,
                 namespace=namespace,
@@ -313,33 +422,176 @@ def create_init_method(namespace: str, real_cls: Any) -> FunctionSchema | None:
     return class_init
 
 
+def parse_class_methods(
+    class_name: str,
+    methods_to_parse: list[GIRepository.CallableInfo],
+) -> dict[str, FunctionSchema]:
+    """
+    Parse the GI methods of a class.
+    Does not depend on the state of the class being parsed.
+
+    Args:
+        class_name (str): name of the class owning the methods
+        methods_to_parse (list[GIRepository.CallableInfo]): GI methods of the class
+    Returns:
+        dict[str, FunctionSchema]: parsed methods keyed by their GI name
+    """
+    parsed_methods: dict[str, FunctionSchema] = {}
+    # singleton: fetched once instead of once per method
+    gir_docs = GIRDocs()
+    for met in methods_to_parse:
+        m_name = met.get_name()
+        if m_name is None:
+            logger.warning("skipping unnamed method of class %s", class_name)
+            continue
+        parsed_method = parse_function(
+            met,
+            docstring=gir_docs.get_class_method_docstring(
+                class_name=class_name,
+                method_name=m_name,
+            ),
+        )
+        if parsed_method:
+            parsed_methods[m_name] = parsed_method
+
+            if parsed_method.name == "connect":
+                msg = f"[note from gi-stub-gen] {class_name} has a connect() method which shadows the signal connect() method to add handlers to GObject.Signals. You can still connect to signals using: GObject.Object.connect(object, 'signal-name', handler)"
+                if parsed_method.docstring is None:
+                    parsed_method.docstring = msg
+                else:
+                    parsed_method.docstring += "\n\n" + msg
+
+    return parsed_methods
+
+
+def parse_class_signals(
+    class_name: str,
+    signals_to_parse: list[GIRepository.SignalInfo],
+) -> dict[str, SignalSchema]:
+    """
+    Parse the GI signals of a class.
+    Does not depend on the state of the class being parsed.
+
+    Args:
+        class_name (str): name of the class owning the signals
+        signals_to_parse (list[GIRepository.SignalInfo]): GI signals of the class
+    Returns:
+        dict[str, SignalSchema]: parsed signals keyed by their GI name
+    """
+    parsed_signals: dict[str, SignalSchema] = {}
+    gir_docs = GIRDocs()
+    for signal in signals_to_parse:
+        signal_name = signal.get_name()
+        if signal_name is None:
+            logger.warning("skipping unnamed signal of class %s", class_name)
+            continue
+        signal_name_unescaped: str = signal.get_name_unescaped()  # type: ignore
+        flags = signal.get_flags()
+
+        s = SignalSchema(
+            name=signal_name,
+            name_unescaped=signal_name_unescaped,
+            namespace=signal.get_namespace(),
+            handler=FunctionSchema.from_gi_object(signal),
+            docstring=gir_docs.get_class_signal_docstring(
+                class_name=class_name,
+                signal_name=signal_name,
+            ),
+            run_first=bool(flags & _SIGNAL_RUN_FIRST),
+            run_last=bool(flags & _SIGNAL_RUN_LAST),
+            run_cleanup=bool(flags & _SIGNAL_RUN_CLEANUP),
+            no_recurse=bool(flags & _SIGNAL_NO_RECURSE),
+            detailed=bool(flags & _SIGNAL_DETAILED),
+            action=bool(flags & _SIGNAL_ACTION),
+            no_hooks=bool(flags & _SIGNAL_NO_HOOKS),
+            must_collect=bool(flags & _SIGNAL_MUST_COLLECT),
+            is_deprecated=bool(flags & _SIGNAL_DEPRECATED),
+        )
+        parsed_signals[signal_name] = s
+
+    return parsed_signals
+
+
+def parse_class_properties(
+    class_name: str,
+    properties_to_parse: list[GIRepository.PropertyInfo],
+) -> dict[str, ClassPropSchema]:
+    """
+    Parse the GI properties of a class.
+    Does not depend on the state of the class being parsed.
+
+    Args:
+        class_name (str): name of the class owning the properties
+        properties_to_parse (list[GIRepository.PropertyInfo]): GI properties of the class
+    Returns:
+        dict[str, ClassPropSchema]: parsed properties keyed by their GI name
+    """
+    parsed_props: dict[str, ClassPropSchema] = {}
+    gir_docs = GIRDocs()
+    for prop in properties_to_parse:
+        # start parsing the actual property
+        prop_gi_type_info = get_gi_type_info(prop)
+
+        # TODO: !! PARSING CALLBACK (credo non possa succedere nelle prop)
+        prop_type = gi_type_to_py_type(prop_gi_type_info)
+        prop_type_hint_namespace = get_py_type_namespace_repr(prop_type)
+        prop_type_hint_name = get_py_type_name_repr(prop_type)
+        p_name = prop.get_name()
+        if p_name is None:
+            logger.warning("skipping unnamed property of class %s", class_name)
+            continue
+        sanitized_name, line_comment = sanitize_variable_name(p_name)
+
+        # may_be_null = is_property_nullable_safe(prop)
+        may_be_null = is_class_field_nullable(prop)
+
+        # each get_flags() call goes through GI, fetch them once
+        p_flags = prop.get_flags()
+
+        parsed_props[p_name] = ClassPropSchema(
+            name=sanitized_name,
+            is_deprecated=prop.is_deprecated(),
+            readable=bool(p_flags & _PARAM_READABLE),
+            writable=bool(p_flags & _PARAM_WRITABLE),
+            type_hint_namespace=prop_type_hint_namespace,
+            type_hint_name=prop_type_hint_name,
+            line_comment=line_comment,
+            docstring=gir_docs.get_class_property_docstring(
+                class_name=class_name,
+                property_name=p_name,
+            ),
+            may_be_null=may_be_null,
+        )
+
+    return parsed_props
+
+
 def parse_class(
     module_name: str,
     class_to_parse: Any,
-) -> tuple[ClassSchema | None, list[GI.TypeInfo]]:
+) -> tuple[ClassSchema | None, list[CallbackSchema]]:
     """
-    Parse a class and return a ClassSchema and a list of GI.TypeInfo callbacks found during parsing.
+    Parse a class and return a ClassSchema and a list of callbacks found during parsing.
+    Callbacks are deduplicated by name, merging their originated_from info.
 
     Args:
         module_name (str): module name where we are parsing the class
         class_to_parse (Any): class to be parsed
         module_docs (ModuleDocs): module documentation
     Returns:
-        tuple[ClassSchema | None, list[GI.TypeInfo]]: parsed ClassSchema and list of GI.TypeInfo callbacks
+        tuple[ClassSchema | None, list[CallbackSchema]]: parsed ClassSchema and list of unique callbacks
     """
-    from gi_stub_gen.schema.class_ import ClassPropSchema, ClassSchema
-
     # Check if it is a class
-    if type(class_to_parse) not in (gi.types.GObjectMeta, gi.types.StructMeta, type):  # type: ignore
+    if type(class_to_parse) not in _CLASS_METATYPES:
         return None, []
 
     # Check if the class is in the same module
     # comparing just the last part of the module name
     # because for overrides the previous part can be different
     # ie from gi.repository.Gio get Gio
-    final_module_name_part = module_name.split(".")[-1].lower()
+    final_module_name_part = get_module_name_last_part(module_name)
     # do the same for the class module
-    class_module_name_part = str(class_to_parse.__module__).split(".")[-1].lower()
+    class_module_name_part = get_module_name_last_part(class_to_parse.__module__)
 
     # we make an exception for gi._gi classes
     # we parse them anyway if we are in _gi module
@@ -352,14 +604,20 @@ def parse_class(
     if final_module_name_part != class_module_name_part:
         # if the class is not in the same namespace as the module, skip it
         # this can happen with classes from gi.repository that are not in the same namespace
+        # %-style: the class repr is only built if the record is actually emitted
         logger.warning(
-            f"[SKIP][CLASS_IN_OTHER_NS]{class_to_parse}, {class_to_parse.__name__}, {str(class_to_parse.__module__)}"
+            "[SKIP][CLASS_IN_OTHER_NS]%s, %s, %s",
+            class_to_parse,
+            class_to_parse.__name__,
+            class_to_parse.__module__,
         )
         return None, []
 
-    # callbacks_found: list[GI.TypeInfo] = []
-    callbacks_found: list[CallbackSchema] = []
-    """callbacks found during class parsing, saved to be parsed later"""
+    # gi namespace of the module (i.e. "Gst"), computed once for all the members
+    namespace = module_name.removeprefix("gi.repository.")
+
+    callbacks_found: dict[str, CallbackSchema] = {}
+    """callbacks found during class parsing (keyed by name), saved to be parsed later"""
 
     class_props: list[ClassPropSchema] = []
     class_fields: list[ClassFieldSchema] = []
@@ -367,80 +625,92 @@ def parse_class(
     class_methods: list[FunctionSchema] = []
     class_python_methods: list[BuiltinFunctionSchema] = []
     class_signals: list[SignalSchema] = []
-    class_parsed_elements: list[str] = []
+    class_parsed_elements: set[str] = set()
     extra: list[str] = []
 
     # retrieve GI info object and parse its properties/methods/signals
-    class_info = class_to_parse.__info__ if hasattr(class_to_parse, "__info__") else None
+    # a single getattr per accessor (None if missing) instead of hasattr + attribute access
+    class_info = getattr(class_to_parse, "__info__", None)
+    get_fields = getattr(class_info, "get_fields", None)
+    get_properties = getattr(class_info, "get_properties", None)
+    get_methods = getattr(class_info, "get_methods", None)
+
     class_signals_to_parse: list[GIRepository.SignalInfo] = get_all_signals_flattened(class_info) if class_info else []
-    class_fields_to_parse: list[GIRepository.FieldInfo] = (
-        class_info.get_fields() if class_info and hasattr(class_info, "get_fields") else []
-    )
-    class_properties_to_parse: list[GIRepository.PropertyInfo] = (
-        class_info.get_properties() if class_info and hasattr(class_info, "get_properties") else []
-    )
-    class_methods_to_parse: list[GIRepository.CallableInfo] = (
-        class_info.get_methods() if class_info and hasattr(class_info, "get_methods") else []
-    )
+    class_fields_to_parse: list[GIRepository.FieldInfo] = get_fields() if get_fields else []
+    class_properties_to_parse: list[GIRepository.PropertyInfo] = get_properties() if get_properties else []
+    class_methods_to_parse: list[GIRepository.CallableInfo] = get_methods() if get_methods else []
+
+    # fields replaced or removed by manual overrides are never emitted:
+    # skip building their schema (see apply_field_overrides)
+    field_overrides = get_field_overrides(module_name, class_to_parse.__name__)
+
+    # names of the GI methods, used to skip fields shadowed by a method.
+    # Built once (only if there are fields) instead of scanning all the methods per field
+    class_method_names = {m.get_name() for m in class_methods_to_parse} if class_fields_to_parse else set()
+
+    # GIR docs of the class fields, resolved once for all the fields parsed below
+    class_field_docs = GIRDocs().get_class_fields_docs(class_to_parse.__name__)
 
     #######################################################################################
     # parse fields
     #######################################################################################
     for field in class_fields_to_parse:
+        # the name is only fetched once here and reused below
+        field_name = field.get_name()
+        if field_name is None:
+            logger.warning("skipping unnamed field of class %s", class_to_parse.__name__)
+            continue
+
         # it is possible to have a both a field and a method
         # with the same name, due to how in C structs are defined
         # in python we keep only the method so we need to check
         # if there is a method with the same name and skip it if so
-        if any(m.get_name() == field.get_name() for m in class_methods_to_parse):
+        if field_name in class_method_names:
             logger.debug(
-                f"skipping field {field.get_name()} of class {class_to_parse.__name__} because there is a method with the same name"
+                "skipping field %s of class %s because there is a method with the same name",
+                field_name,
+                class_to_parse.__name__,
             )
             continue
 
-        if not should_expose_class_field(field):
-            logger.debug(f"not exposing field {field.get_name()} of class {class_to_parse.__name__}")
+        if not should_expose_class_field(field, name=field_name):
+            logger.debug("not exposing field %s of class %s", field_name, class_to_parse.__name__)
             continue
 
-        field_name = field.get_name()
-        assert field_name is not None
         if not is_local(class_to_parse, field_name):
             continue
 
+        if is_field_overridden(field_overrides, field_name):
+            class_parsed_elements.add(field_name)
+            continue
+
         f, cb = gi_parse_field(
             field=field,
-            module_name=module_name,
+            namespace=namespace,
             class_name=class_to_parse.__name__,
+            field_name=field_name,
+            field_docs=class_field_docs,
         )
         if cb is not None:
-            callbacks_found.append(cb)
+            add_found_callback(callbacks_found, cb)
         class_fields.append(f)
-        class_parsed_elements.append(field_name)
+        class_parsed_elements.add(field_name)
 
     #######################################################################################
     # parse methods
     #######################################################################################
-    for met in class_methods_to_parse:
-        m_name = met.get_name()
-        assert m_name is not None, "Method name is None"
-        parsed_method = parse_function(
-            met,
-            docstring=GIRDocs().get_class_method_docstring(
-                class_name=class_to_parse.__name__,
-                method_name=m_name,
-            ),
-        )
-        if parsed_method:
+    # many classes (i.e. plain structs or interfaces) have no methods/signals/props:
+    # skip the parsing helpers entirely when there is nothing to parse
+    if class_methods_to_parse:
+        parsed_methods = parse_class_methods(class_to_parse.__name__, class_methods_to_parse)
+        for parsed_method in parsed_methods.values():
             # save callbacks to be parsed later
-            callbacks_found.extend(parsed_method._gi_callbacks)
-            class_methods.append(parsed_method)
-            class_parsed_elements.append(m_name)
-
-            if parsed_method.name == "connect":
-                msg = f"[note from gi-stub-gen] {class_to_parse.__name__} has a connect() method which shadows the signal connect() method to add handlers to GObject.Signals. You can still connect to signals using: GObject.Object.connect(object, 'signal-name', handler)"
-                if parsed_method.docstring is None:
-                    parsed_method.docstring = msg
-                else:
-                    parsed_method.docstring += "\n\n" + msg
+            # (most methods have none: skip the inner loop for them)
+            if method_callbacks := parsed_method._gi_callbacks:
+                for cb in method_callbacks:
+                    add_found_callback(callbacks_found, cb)
+        class_methods.extend(parsed_methods.values())
+        class_parsed_elements.update(parsed_methods)
 
     #######################################################################################
     # parse signals
@@ -449,74 +719,21 @@ def parse_class(
     # because they are shadowd by the method
     # for example this happens in Gio.SocketClient where its connect() method
     # shadows the connect() method added by GObject.Signals
-    if "connect" not in class_parsed_elements:
+    if class_signals_to_parse and "connect" not in class_parsed_elements:
         # notify::<property_name>> -> will be added when parsing properties
         # signal-name
-        for signal in class_signals_to_parse:
-            signal_name = signal.get_name()
-            assert signal_name is not None
-            signal_name_unescaped: str = signal.get_name_unescaped()  # type: ignore
-            flags = signal.get_flags()
-
-            s = SignalSchema(
-                name=signal_name,
-                name_unescaped=signal_name_unescaped,
-                namespace=signal.get_namespace(),
-                handler=FunctionSchema.from_gi_object(signal),
-                docstring=GIRDocs().get_class_signal_docstring(
-                    class_name=class_to_parse.__name__,
-                    signal_name=signal_name,
-                ),
-                run_first=bool(flags & GObject.SignalFlags.RUN_FIRST),
-                run_last=bool(flags & GObject.SignalFlags.RUN_LAST),
-                run_cleanup=bool(flags & GObject.SignalFlags.RUN_CLEANUP),
-                no_recurse=bool(flags & GObject.SignalFlags.NO_RECURSE),
-                detailed=bool(flags & GObject.SignalFlags.DETAILED),
-                action=bool(flags & GObject.SignalFlags.ACTION),
-                no_hooks=bool(flags & GObject.SignalFlags.NO_HOOKS),
-                must_collect=bool(flags & GObject.SignalFlags.MUST_COLLECT),
-                is_deprecated=bool(flags & GObject.SignalFlags.DEPRECATED),
-            )
-            # if signal_name == "notify":
-            #     breakpoint()
-            class_signals.append(s)
-            class_parsed_elements.append(signal_name)
+        parsed_signals = parse_class_signals(class_to_parse.__name__, class_signals_to_parse)
+        class_signals.extend(parsed_signals.values())
+        class_parsed_elements.update(parsed_signals)
 
     #######################################################################################
     # parse properties
     #######################################################################################
     # Parse Props (they have a getter/setter depending on the flags)
-    for prop in class_properties_to_parse:
-        # start parsing the actual property
-        prop_gi_type_info = get_gi_type_info(prop)
-
-        # TODO: !! PARSING CALLBACK (credo non possa succedere nelle prop)
-        prop_type = gi_type_to_py_type(prop_gi_type_info)
-        prop_type_hint_namespace = get_py_type_namespace_repr(prop_type)
-        prop_type_hint_name = get_py_type_name_repr(prop_type)
-        p_name = prop.get_name()
-        assert p_name is not None, "Property name is None"
-        sanitized_name, line_comment = sanitize_variable_name(p_name)
-
-        # may_be_null = is_property_nullable_safe(prop)
-        may_be_null = is_class_field_nullable(prop)
-
-        c = ClassPropSchema(
-            name=sanitized_name,
-            is_deprecated=prop.is_deprecated(),
-            readable=bool(prop.get_flags() & GObject.ParamFlags.READABLE),
-            writable=bool(prop.get_flags() & GObject.ParamFlags.WRITABLE),
-            type_hint_namespace=prop_type_hint_namespace,
-            type_hint_name=prop_type_hint_name,
-            line_comment=line_comment,
-            docstring=GIRDocs().get_class_property_docstring(
-                class_name=class_to_parse.__name__,
-                property_name=p_name,
-            ),
-            may_be_null=may_be_null,
-        )
-        class_props.append(c)
-        class_parsed_elements.append(p_name)
+    if class_properties_to_parse:
+        parsed_props = parse_class_properties(class_to_parse.__name__, class_properties_to_parse)
+        class_props.extend(parsed_props.values())
+        class_parsed_elements.update(parsed_props)
 
     # also add the notify signal #########################################
     # notify::<property_name>
@@ -529,7 +746,9 @@ def parse_class(
     if "connect" not in class_parsed_elements:
         for prop in get_all_properties_flattened(class_info):
             p_name = prop.get_name()
-            assert p_name is not None, "Property name is None"
+            if p_name is None:
+                # already reported while parsing the class properties
+                continue
             sanitized_name, line_comment = sanitize_variable_name(p_name)
             signal_name_unescaped: str = prop.get_name_unescaped()  # type: ignore
             class_signals.append(
@@ -549,7 +768,7 @@ def parse_class(
     # we rely on GIRepository to get them
     # this way we also parse fields that appear when instantiating the class
     type_info = GIRepo().find_by_name(
-        module_name.removeprefix("gi.repository."),
+        namespace,
         class_to_parse.__name__,
         target_type=GIRepository.BaseInfo,
     )
@@ -557,69 +776,67 @@ def parse_class(
         for i in range(type_info.get_n_fields()):
             field = type_info.get_field(i)
             field_name = field.get_name()
-            assert field_name is not None
-            if field_name not in class_parsed_elements:
-                f, cb = gi_parse_field(
-                    field=field,
-                    module_name=module_name,
-                    class_name=class_to_parse.__name__,
-                )
-                if cb is not None:
-                    callbacks_found.append(cb)
-                class_fields.append(f)
-                class_parsed_elements.append(field_name)
+            if field_name is None:
+                logger.warning("skipping unnamed field of class %s", class_to_parse.__name__)
+                continue
+            if field_name in class_parsed_elements:
+                continue
+
+            if is_field_overridden(field_overrides, field_name):
+                class_parsed_elements.add(field_name)
+                continue
+
+            f, cb = gi_parse_field(
+                field=field,
+                namespace=namespace,
+                class_name=class_to_parse.__name__,
+                field_name=field_name,
+                field_docs=class_field_docs,
+            )
+            if cb is not None:
+                add_found_callback(callbacks_found, cb)
+            class_fields.append(f)
+            class_parsed_elements.add(field_name)
 
     #######################################################################################
     # OVERRIDES AND NATIVE PYTHON CLASS ATTRIBUTES
     #######################################################################################
     # do a second pass to get all the attributes not parsed by get_properties/get_methods
     # i.e class not from GI but added in overrides
-    for attribute_name in dir(class_to_parse):
-        if attribute_name.startswith("_") and attribute_name != "__init__":
-            # skip dunder methods
-            continue
-        try:
-            attribute = getattr(class_to_parse, attribute_name)
-        except AttributeError as e:
-            logger.warning(f"Could not get attribute {attribute_name} from {class_to_parse.__name__}: {e}")
-            breakpoint()
+    # we only parse local attributes, not inherited ones, so we walk the class __dict__
+    # instead of dir() which also walks the whole MRO.
+    # Names are sorted to keep the same (deterministic) order of dir().
+    # NOTE: we still use getattr to resolve descriptors (i.e. classmethod -> bound method)
+    # private and dunder names are filtered out once, before the loop (__init__ is kept)
+    attribute_names = [n for n in sorted(class_to_parse.__dict__) if n == "__init__" or not n.startswith("_")]
+    gir_docs = GIRDocs()
+    # parsed GI methods by name, to flag the ones overridden in python with a lookup
+    # (reversed so that the first method with a given name wins, as with a linear scan)
+    class_methods_by_name = {m.name: m for m in reversed(class_methods)}
+    for attribute_name in attribute_names:
+        attribute = getattr(class_to_parse, attribute_name, _MISSING)
+        if attribute is _MISSING:
+            logger.warning("Could not get attribute %s from %s", attribute_name, class_to_parse.__name__)
             continue
 
         attribute_type = type(attribute)
 
-        # do not parse already parsed elements
-        # i.e. the gi ones
-        # if attribute_name in class_parsed_elements:
-        #     # set the previously parsed element as overridden
-        #     if attribute_name in [m.name for m in class_methods]:
-        #         for m in class_methods:
-        #             if m.name == attribute_name:
-        #                 m.is_overridden = True
-        #                 break
-        #     else:
-        #         breakpoint()
-        #     continue
-
-        # we only parse local attributes, not inherited ones
-        is_attribute_local = is_local(class_to_parse, attribute_name)
-        if not is_attribute_local:
-            continue
-
-        if c := parse_constant(
+        if isinstance(attribute, _CONSTANT_CANDIDATE_TYPES) and parse_constant(
             module_name="",
             name=attribute_name,
             obj=attribute,
-            docstring=GIRDocs().get_class_field_docstring(
+            docstring=gir_docs.get_class_field_docstring(
                 class_name=class_to_parse.__name__,
                 field_name=attribute_name,
             ),
         ):
-            extra.append(f"constant: {attribute_name} local={is_attribute_local}")
+            extra.append(f"constant: {attribute_name}")
 
         elif attribute_type is GetSetDescriptorType:
-            if attribute_name in class_parsed_elements:
-                assert False, f"was parsed twice? Please open an issue. {attribute_name} in {class_to_parse.__name__}"
-                # breakpoint()
+            # a plain assert so the membership check is also dropped under python -O
+            assert attribute_name not in class_parsed_elements, (
+                f"was parsed twice? Please open an issue. {attribute_name} in {class_to_parse.__name__}"
+            )
             # these are @property since it's impossibile to know if they are writable or not
             # in classfield will be considered a property
             # when is_readable but not is_writable
@@ -638,10 +855,10 @@ def parse_class(
                 )
             )
 
-        elif attribute_type in {MethodType, FunctionType, BuiltinFunctionType}:
+        elif attribute_type in _PYTHON_FUNCTION_TYPES:
             if f := parse_python_function(
                 attribute=attribute,
-                namespace=module_name.removeprefix("gi.repository."),
+                namespace=namespace,
                 name_override=attribute_name,
             ):
                 if f.name == "__init__":
@@ -652,55 +869,52 @@ def parse_class(
                         f.return_hint_namespace = None
 
                 class_python_methods.append(f)
-                if attribute_name in class_parsed_elements:
+                if (
+                    attribute_name in class_parsed_elements
+                    and (overridden_method := class_methods_by_name.get(attribute_name)) is not None
+                ):
                     # set the previously parsed element as overridden
-                    for m in class_methods:
-                        if m.name == attribute_name:
-                            m.is_overridden = True
-                            if f.docstring:
-                                f.docstring = f"[is-override: Note this method is an override in Python of the original gi implementation.]\n\n{f.docstring}"
-                            else:
-                                f.docstring = "[is-override: Note this method is an override in Python of the original gi implementation.]"
-                            break
-                    # assert attribute_name not in class_parsed_elements, "was parsed twice?"
-                class_parsed_elements.append(attribute_name)
-
-        elif attribute_type is MethodDescriptorType:
-            extra.append(f"method_descriptor: {attribute_name} local={is_attribute_local}")
-        elif attribute_type is property:
-            extra.append(f"property: {attribute_name} local={is_attribute_local}")
+                    overridden_method.is_overridden = True
+                    f.docstring = f"{_IS_OVERRIDE_NOTE}\n\n{f.docstring}" if f.docstring else _IS_OVERRIDE_NOTE
+                class_parsed_elements.add(attribute_name)
+
+        elif label := _EXTRA_ATTRIBUTE_LABELS.get(attribute_type):
+            extra.append(f"{label}: {attribute_name}")
         else:
-            extra.append(f"unknown: {attribute_name}: {attribute_type} local={is_attribute_local}")
+            extra.append(f"unknown: {attribute_name}: {attribute_type}")
 
     # manual override
     # i.e. in GIRepository.TypeInfo we add get_tag_as_string method
     # which is not present in gi.TypeInfo
     # since it has been injected by pygobject
-    class_methods = apply_method_overrides(
-        class_methods,
-        namespace=module_name,
-        class_name=class_to_parse.__name__,
-    )
-    class_fields = apply_field_overrides(
-        class_fields,
-        namespace=module_name,
-        class_name=class_to_parse.__name__,
-    )
+    if has_class_overrides(module_name, class_to_parse.__name__):
+        class_methods = apply_method_overrides(
+            class_methods,
+            namespace=module_name,
+            class_name=class_to_parse.__name__,
+        )
+        class_fields = apply_field_overrides(
+            class_fields,
+            namespace=module_name,
+            class_name=class_to_parse.__name__,
+        )
 
     # add __init__ method
     is_init_present_in_methods = any(method.name == "__init__" for method in class_methods)
     is_init_present_in_python_methods = any(method.name == "__init__" for method in class_python_methods)
     if not (is_init_present_in_methods or is_init_present_in_python_methods):
         if init_method := create_init_method(
-            namespace=module_name.removeprefix("gi.repository."),
+            namespace=namespace,
             real_cls=class_to_parse,
         ):
             class_methods.insert(0, init_method)
 
     # sort methods by name
-    class_fields.sort(key=lambda x: x.name)
-    class_methods.sort(key=lambda x: x.name)
-    class_props.sort(key=lambda x: x.name)
+    # (in place: the lists are handed over to the ClassSchema, no copies needed)
+    class_fields.sort(key=_by_name)
+    class_methods.sort(key=_by_name)
+    class_props.sort(key=_by_name)
+    extra.sort()
 
     return ClassSchema.from_gi_object(
         namespace=module_name,
@@ -710,5 +924,5 @@ def parse_class(
         methods=class_methods,
         builtin_methods=class_python_methods,
         signals=class_signals,
-        extra=sorted(extra),
-    ), callbacks_found
+        extra=extra,
+    ), list(callbacks_found.values())
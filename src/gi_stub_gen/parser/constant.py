@@ -11,6 +11,9 @@ from gi.repository import GObject
 from typing import Any
 from gi_stub_gen.schema.constant import VariableSchema
 
+_BUILTIN_CONSTANT_TYPES = frozenset({int, str, float, dict, tuple, list, bool})
+"""python builtin types parsed as plain constants"""
+
 
 def parse_constant(
     module_name: str,  # module we are parsing
@@ -31,7 +34,7 @@ def parse_constant(
         VariableSchema | None
     """
 
-    if type(obj) in (int, str, float, dict, tuple, list, bool):
+    if type(obj) in _BUILTIN_CONSTANT_TYPES:
         return VariableSchema.from_gi_object(
             obj=obj,
             namespace=module_name,
@@ -42,8 +45,8 @@ def parse_constant(
 
     w = catch_gi_deprecation_warnings(module_name, name)
     # check if it is a constant from an enum/flag
-    if hasattr(obj, "__info__"):
-        info = getattr(obj, "__info__")
+    info = getattr(obj, "__info__", None)
+    if info is not None:
         # both enums and flags have __info__ attribute of type EnumInfo
         # example, this is a flag:
         # type(getattr(Gst.BUFFER_COPY_METADATA, "__info__")) == GI.EnumInfo
@@ -11,6 +11,10 @@ from gi.repository import GIRepository
 
 logger = logging.getLogger(__name__)
 
+# pygobject classes can also derive from the python Enum/Flag (new pygobject Enum support)
+_FLAGS_BASES = (GObject.GFlags, Flag)
+_ENUM_BASES = (GObject.GEnum, Enum)
+
 
 def parse_enum(
     attribute: Any,
@@ -21,41 +25,50 @@ def parse_enum(
     if not isinstance(attribute, type):
         return None
 
-    is_flags = issubclass(attribute, GObject.GFlags) or issubclass(attribute, Flag)  # due to new pygobject Enum support
-    is_enum = issubclass(attribute, GObject.GEnum) or issubclass(attribute, Enum)  # due to new pygobject Enum support
+    # a single issubclass call (one MRO walk) per kind
+    is_flags = issubclass(attribute, _FLAGS_BASES)
+    is_enum_or_flags = is_flags or issubclass(attribute, _ENUM_BASES)
 
-    if is_flags or is_enum:
+    if is_enum_or_flags:
         # GObject.Enum and Gobject.Flags do not have __info__ attribute
-        if hasattr(attribute, "__info__"):
-            _type_info: GIRepository.EnumInfo = attribute.__info__  # type: ignore
-
+        _type_info: GIRepository.EnumInfo | None = getattr(attribute, "__info__", None)
+        if _type_info is not None:
             # to retrieve its docstring we need to get the name of the class
-            class_name = attribute.__info__.get_name()  # type: ignore
-            class_docstring = GIRDocs().get_enum_docstring(class_name)
+            class_name = _type_info.get_name()
+            # singleton: fetched once instead of once per enum/flag value
+            gir_docs = GIRDocs()
+            class_docstring = gir_docs.get_enum_docstring(class_name)
             ##############################
 
             # parse all possible enum/flag values
             # and retrieve their docstrings
-            args: dict[str, EnumFieldSchema] = {}
+            # fields in GI order, deduplicated by name
+            fields: list[EnumFieldSchema] = []
+            seen_field_names: set[str] = set()
+            # docs of the values resolved once per enum (often empty, i.e. undocumented flags)
+            fields_docs = gir_docs.get_enum_fields_docs(class_name)
             for v in _type_info.get_values():  # type: ignore added by pygobject
-                field_docstring = GIRDocs().get_enum_field_docstring(class_name, v.get_name())
+                value_name = v.get_name()
+                raw_docstring = fields_docs.get(value_name) if fields_docs else None
                 parsed_field = EnumFieldSchema.from_gi_value_info(
                     value_info=v,
-                    docstring=field_docstring,
+                    docstring=None if raw_docstring is None else gir_docs.translate_c_doc_to_python(raw_docstring),
                     deprecation_warnings=None,
+                    name=value_name,
                 )
 
-                if parsed_field.name in args:
+                if parsed_field.name in seen_field_names:
                     logger.warning(
                         f"Enum/Flag {class_name} has duplicate field name {parsed_field.name}. Skipping duplicate."
                     )
                     continue
-                args[parsed_field.name] = parsed_field
+                seen_field_names.add(parsed_field.name)
+                fields.append(parsed_field)
 
             return EnumSchema.from_gi_object(
                 obj=attribute,
                 enum_type="flags" if is_flags else "enum",
-                fields=[a for a in args.values()],
+                fields=fields,
                 docstring=class_docstring,
             )
         else:
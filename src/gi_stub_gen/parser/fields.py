@@ -13,11 +13,22 @@ from gi_stub_gen.utils.gi_utils import (
 )
 from gi_stub_gen.utils.utils import get_py_type_name_repr, get_py_type_namespace_repr, sanitize_variable_name
 
+# struct/class fields never exposed in the stubs (GObject/GTypeInstance internals)
+_SKIP_FIELD_NAMES = frozenset({"parent", "parent_instance", "g_type_instance", "priv"})
+
+# resolved once instead of walking the attribute chains for every field
+_FIELD_READABLE = GIRepository.FieldInfoFlags.READABLE
+_FIELD_WRITABLE = GIRepository.FieldInfoFlags.WRITABLE
+_TAG_INTERFACE = GIRepository.TypeTag.INTERFACE
+_TAG_VOID = GIRepository.TypeTag.VOID
+
 
 def gi_parse_field(
     field: GIRepository.FieldInfo | GI.FieldInfo,
-    module_name: str,
+    namespace: str,
     class_name: str,
+    field_name: str | None = None,
+    field_docs: dict[str, str] | None = None,
 ) -> tuple[ClassFieldSchema, CallbackSchema | None]:
     """
     Parse a struct/class field.
@@ -25,22 +36,28 @@ def gi_parse_field(
 
     Args:
         field (GIRepository.FieldInfo | GI.FieldInfo): field info object
-        module_name (str): module name where the class is defined
+        namespace (str): gi namespace where the class is defined (i.e. "Gst", without gi.repository.)
         class_name (str): class name where the field is defined
+        field_name (str | None): name of the field, if already fetched by the caller
+            (saves a call into GI), otherwise it is retrieved from the field info
+        field_docs (dict[str, str] | None): raw GIR docs of the class fields (see GIRDocs.get_class_fields_docs),
+            if already fetched by the caller, otherwise the docstring is looked up in GIRDocs
 
     Returns:
         tuple: parsed ClassFieldSchema and found CallbackSchema (if any)
     """
 
-    field_name = field.get_name()
-    assert field_name is not None
+    if field_name is None:
+        field_name = field.get_name()
+    if field_name is None:
+        raise ValueError(f"Unnamed field found in class {class_name}")
 
     found_callback: CallbackSchema | None = None
     """callbacks found during field parsing, saved to be parsed later"""
 
     flags = field.get_flags()
-    is_readable = bool(flags & GIRepository.FieldInfoFlags.READABLE)
-    is_writable = bool(flags & GIRepository.FieldInfoFlags.WRITABLE)
+    is_readable = bool(flags & _FIELD_READABLE)
+    is_writable = bool(flags & _FIELD_WRITABLE)
 
     field_name, line_comment = sanitize_variable_name(field_name)
     field_gi_type_info = get_gi_type_info(field)
@@ -51,7 +68,7 @@ def gi_parse_field(
 
         # if callback is from another namespace, keep original name
         # otherwise append class name to avoid name clashes
-        if cb_namespace != module_name.removeprefix("gi.repository."):
+        if cb_namespace != namespace:
             cb_name = cb_info.get_name()
         else:
             cb_name = cb_info.get_name() + f"{class_name}CB"
@@ -78,15 +95,22 @@ def gi_parse_field(
         prop_type_hint_name = get_py_type_name_repr(field_py_type)
         may_be_null = is_class_field_nullable(field)
 
+    if field_docs is None:
+        docstring = GIRDocs().get_class_field_docstring(
+            class_name=class_name,
+            field_name=field_name,
+        )
+    elif field_name in field_docs:
+        docstring = GIRDocs().translate_c_doc_to_python(field_docs[field_name])
+    else:
+        docstring = None
+
     return ClassFieldSchema(
         name=field_name,
         type_hint_name=prop_type_hint_name,
         type_hint_namespace=prop_type_hint_namespace,
         is_deprecated=field.is_deprecated(),
-        docstring=GIRDocs().get_class_field_docstring(
-            class_name=class_name,
-            field_name=field_name,
-        ),
+        docstring=docstring,
         line_comment=line_comment,
         deprecation_warnings=None,
         may_be_null=may_be_null,
@@ -97,31 +121,34 @@ def gi_parse_field(
 
 def should_expose_class_field(
     field_info: GIRepository.FieldInfo,
+    name: str | None = None,
 ) -> bool:
     """
     Determines if a class field should be exposed in the generated stub.
+    The field name can be passed if already fetched by the caller.
     """
 
-    name = field_info.get_name()
+    # checks are ordered from the cheapest (name only) to the most expensive
+    # (flags and type info both go through GI), bailing out as soon as possible
+    if name is None:
+        name = field_info.get_name()
 
     if not name:
         return False
 
-    flags = field_info.get_flags()
-
     if name.startswith("_"):
         return False
 
-    if name in ("parent", "parent_instance", "g_type_instance", "priv"):
+    if name in _SKIP_FIELD_NAMES:
         return False
 
-    if not (flags & GIRepository.FieldInfoFlags.READABLE):
+    if not (field_info.get_flags() & _FIELD_READABLE):
         return False
 
     type_info = get_gi_type_info(field_info)
     tag = type_info.get_tag()
 
-    if tag == GIRepository.TypeTag.INTERFACE:
+    if tag == _TAG_INTERFACE:
         interface_info = type_info.get_interface()
 
         # do not expose callback interfaces as simple fields
@@ -133,6 +160,6 @@ def should_expose_class_field(
             return False
 
     # discard void fields ??
-    if tag == GIRepository.TypeTag.VOID:
+    if tag == _TAG_VOID:
         return False
     return True
@@ -4,17 +4,64 @@ Parser for GIR files to extract documentation.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 import logging
 
 from lxml import etree
-from pydantic import BaseModel
 
 
 logger = logging.getLogger(__name__)
 
-
-class GirFunctionDocs(BaseModel):
+_GIR_NS = {
+    "core": "http://www.gtk.org/introspection/core/1.0",
+    "c": "http://www.gtk.org/introspection/c/1.0",
+    "glib": "http://www.gtk.org/introspection/glib/1.0",
+}
+"""namespaces used in GIR files, shared by every lookup"""
+
+# tags of direct children in Clark notation, looked up with iterchildren()
+# which is cheaper than going through the path engine for every node
+_CORE = "{" + _GIR_NS["core"] + "}"
+_DOC_TAG = f"{_CORE}doc"
+_PARAMETERS_TAG = f"{_CORE}parameters"
+_PARAMETER_TAG = f"{_CORE}parameter"
+_INSTANCE_PARAMETER_TAG = f"{_CORE}instance-parameter"
+_RETURN_VALUE_TAG = f"{_CORE}return-value"
+_MEMBER_TAG = f"{_CORE}member"
+_FIELD_TAG = f"{_CORE}field"
+_PROPERTY_TAG = f"{_CORE}property"
+_METHOD_TAG = f"{_CORE}method"
+_FUNCTION_TAG = f"{_CORE}function"
+_CONSTRUCTOR_TAG = f"{_CORE}constructor"
+_SIGNAL_TAG = "{" + _GIR_NS["glib"] + "}signal"
+
+# namespace level elements collected while streaming the file
+_NAMESPACE_TAG = f"{_CORE}namespace"
+_CONSTANT_TAG = f"{_CORE}constant"
+_BITFIELD_TAG = f"{_CORE}bitfield"
+_ENUMERATION_TAG = f"{_CORE}enumeration"
+_CLASS_TAG = f"{_CORE}class"
+_RECORD_TAG = f"{_CORE}record"
+_INTERFACE_TAG = f"{_CORE}interface"
+_TOP_LEVEL_TAGS = (
+    _CONSTANT_TAG,
+    _FUNCTION_TAG,
+    _BITFIELD_TAG,
+    _ENUMERATION_TAG,
+    _CLASS_TAG,
+    _RECORD_TAG,
+    _INTERFACE_TAG,
+)
+
+
+# the docs containers below are plain frozen dataclasses instead of pydantic models:
+# one is built per GIR element from values already typed by the parser,
+# so validation adds nothing and slots keep large GIR files cheap in memory
+
+
+@dataclass(frozen=True, slots=True)
+class GirFunctionDocs:
     """
     Documentation for any callable entity (Function, Method, Signal, Constructor).
     """
@@ -24,7 +71,8 @@ class GirFunctionDocs(BaseModel):
     return_doc: str
 
 
-class GirClassDocs(BaseModel):
+@dataclass(frozen=True, slots=True)
+class GirClassDocs:
     """Class documentation extracted from GIR."""
 
     class_docstring: str
@@ -34,7 +82,8 @@ class GirClassDocs(BaseModel):
     properties: dict[str, str]  # GObject Properties <property>
 
 
-class ModuleDocs(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ModuleDocs:
     """Top-level container for all documentation in a GIR module."""
 
     module_namespace: str
@@ -46,50 +95,44 @@ class ModuleDocs(BaseModel):
     classes: dict[str, GirClassDocs]  # Classes, Records, Interfaces
 
 
-def _get_first_doc_text(
-    element: etree._Element,
-    namespace: dict[str, str],
-) -> str:
+def _get_first_doc_text(element: etree._Element) -> str:
     """
     Helper to safely extract and clean the text of the first <doc> child tag.
     """
-    docs = element.findall("core:doc", namespaces=namespace)
-    if docs and docs[0].text:
-        return docs[0].text
+    doc = next(element.iterchildren(_DOC_TAG), None)
+    if doc is not None and doc.text:
+        return doc.text
     return ""
 
 
-def _extract_function_docs(
-    element: etree._Element,
-    namespace: dict[str, str],
-) -> GirFunctionDocs:
+def _extract_function_docs(element: etree._Element) -> GirFunctionDocs:
     """
     Extracts documentation for any function-like node (method, function, constructor, signal).
     """
-    docstring = _get_first_doc_text(element, namespace)
+    docstring = _get_first_doc_text(element)
 
     # Extract parameters
     params_docs: dict[str, str] = {}
-    parameters = element.find("core:parameters", namespaces=namespace)
+    parameters = next(element.iterchildren(_PARAMETERS_TAG), None)
     if parameters is not None:
         # We iterate over <parameter> and <instance-parameter> (for methods)
-        # We use findall for direct children to avoid traversing too deep or wrong nodes
-        for param in parameters.findall("core:parameter", namespaces=namespace):
+        # We use iterchildren for direct children to avoid traversing too deep or wrong nodes
+        for param in parameters.iterchildren(_PARAMETER_TAG):
             param_name = param.attrib.get("name")
             if param_name:
-                params_docs[param_name] = _get_first_doc_text(param, namespace)
+                params_docs[param_name] = _get_first_doc_text(param)
 
         # Optionally handle instance-parameter if needed (usually 'self', often ignored)
-        for param in parameters.findall("core:instance-parameter", namespaces=namespace):
+        for param in parameters.iterchildren(_INSTANCE_PARAMETER_TAG):
             param_name = param.attrib.get("name")
             if param_name and param_name != "self":  # Skip self usually
-                params_docs[param_name] = _get_first_doc_text(param, namespace)
+                params_docs[param_name] = _get_first_doc_text(param)
 
     # Extract return value documentation
     return_docstring = ""
-    return_val = element.find("core:return-value", namespaces=namespace)
+    return_val = next(element.iterchildren(_RETURN_VALUE_TAG), None)
     if return_val is not None:
-        return_docstring = _get_first_doc_text(return_val, namespace)
+        return_docstring = _get_first_doc_text(return_val)
 
     return GirFunctionDocs(
         docstring=docstring,
@@ -98,146 +141,96 @@ def _extract_function_docs(
     )
 
 
-def parse_constants(
-    path: str,
-    root: etree._ElementTree,
-    namespace: dict[str, str],
-) -> dict[str, str]:
-    """Parses global constants documentation."""
-    constant_docs: dict[str, str] = {}
-    for f in root.xpath(path, namespaces=namespace):  # type: ignore
-        name = f.attrib.get("name")
-        if name:
-            constant_docs[name] = _get_first_doc_text(f, namespace)  # type: ignore
-    return constant_docs
-
-
-def parse_global_functions(
-    path: str,
-    root: etree._ElementTree,
-    namespace: dict[str, str],
-) -> dict[str, GirFunctionDocs]:
-    """Parses global module functions."""
-    function_docs: dict[str, GirFunctionDocs] = {}
-
-    for f in root.xpath(path, namespaces=namespace):  # type: ignore
-        name = f.attrib.get("name")
-        if not name:
-            continue
-        function_docs[name] = _extract_function_docs(f, namespace)  # type: ignore
-
-    return function_docs
-
-
 def _parse_simple_container(
-    path: str,
-    root: etree._ElementTree,
-    namespace: dict[str, str],
+    container: etree._Element,
     member_tag: str,
-) -> dict[str, GirClassDocs]:
+) -> GirClassDocs:
     """
     Parses simple containers like Enumerations and Bitfields.
     """
-    docs: dict[str, GirClassDocs] = {}
+    class_docstring = _get_first_doc_text(container)
+    members_docs: dict[str, str] = {}
+
+    # Use iterchildren for performance and type safety on direct children
+    for member in container.iterchildren(member_tag):
+        member_name = member.attrib.get("name")
+        if member_name:
+            members_docs[member_name] = _get_first_doc_text(member)
+
+    return GirClassDocs(
+        class_docstring=class_docstring,
+        fields=members_docs,
+        methods={},
+        signals={},
+        properties={},
+    )
 
-    for container in root.xpath(path, namespaces=namespace):  # type: ignore
-        name = container.attrib.get("name")
-        if not name:
-            continue
 
-        class_docstring = _get_first_doc_text(container, namespace)  # type: ignore
-        members_docs: dict[str, str] = {}
-
-        # Use findall for performance and type safety on direct children
-        for member in container.findall(member_tag, namespaces=namespace):
-            member_name = member.attrib.get("name")
-            if member_name:
-                members_docs[member_name] = _get_first_doc_text(member, namespace)
-
-        docs[name] = GirClassDocs(
-            class_docstring=class_docstring,
-            fields=members_docs,
-            methods={},
-            signals={},
-            properties={},
-        )
-    return docs
-
-
-def parse_classes(
-    path: str,
-    root: etree._ElementTree,
-    namespace: dict[str, str],
-) -> dict[str, GirClassDocs]:
+def parse_class(container: etree._Element) -> GirClassDocs:
     """
     Parses complex types: Classes, Interfaces, and Records.
     Extracts fields, methods, constructors, static methods, and signals.
     """
-    docs: dict[str, GirClassDocs] = {}
-
-    for container in root.xpath(path, namespaces=namespace):  # type: ignore
-        name = container.attrib.get("name")
-        if not name:
-            continue
-
-        class_docstring = _get_first_doc_text(container, namespace)  # type: ignore
-
-        # 1. Parse Fields (core:field)
-        fields_docs: dict[str, str] = {}
-        for field in container.findall("core:field", namespaces=namespace):
-            field_name = field.attrib.get("name")
-            if field_name:
-                fields_docs[field_name] = _get_first_doc_text(field, namespace)
-
-        # 2. Parse Properties (core:property)
-        properties_docs: dict[str, str] = {}
-        for prop in container.findall("core:property", namespaces=namespace):
-            prop_name = prop.attrib.get("name")
-            if prop_name:
-                properties_docs[prop_name] = _get_first_doc_text(prop, namespace)
-
-        # 3. Parse Instance Methods (core:method)
-        methods_docs: dict[str, GirFunctionDocs] = {}
-        for method in container.findall("core:method", namespaces=namespace):
-            method_name = method.attrib.get("name")
-            if method_name:
-                methods_docs[method_name] = _extract_function_docs(method, namespace)
-
-        # 4. Parse Static Methods (core:function inside the class)
-        static_methods_docs: dict[str, GirFunctionDocs] = {}
-        for func in container.findall("core:function", namespaces=namespace):
-            func_name = func.attrib.get("name")
-            if func_name:
-                static_methods_docs[func_name] = _extract_function_docs(func, namespace)
-
-        # 5. Parse Constructors (core:constructor)
-        constructors_docs: dict[str, GirFunctionDocs] = {}
-        for ctor in container.findall("core:constructor", namespaces=namespace):
-            ctor_name = ctor.attrib.get("name")
-            if ctor_name:
-                constructors_docs[ctor_name] = _extract_function_docs(ctor, namespace)
-
-        # 6. Parse Signals (glib:signal)
-        # Note: Signals use the 'glib' namespace, not 'core'
-        signals_docs: dict[str, GirFunctionDocs] = {}
-        for signal in container.findall("glib:signal", namespaces=namespace):
-            sig_name = signal.attrib.get("name")
-            if sig_name:
-                signals_docs[sig_name] = _extract_function_docs(signal, namespace)
-
-        docs[name] = GirClassDocs(
-            class_docstring=class_docstring,
-            fields=fields_docs,
-            methods={**methods_docs, **static_methods_docs, **constructors_docs},
-            signals=signals_docs,
-            properties=properties_docs,
-        )
-    return docs
+    class_docstring = _get_first_doc_text(container)
+
+    # 1. Parse Fields (core:field)
+    fields_docs: dict[str, str] = {}
+    for field in container.iterchildren(_FIELD_TAG):
+        field_name = field.attrib.get("name")
+        if field_name:
+            fields_docs[field_name] = _get_first_doc_text(field)
+
+    # 2. Parse Properties (core:property)
+    properties_docs: dict[str, str] = {}
+    for prop in container.iterchildren(_PROPERTY_TAG):
+        prop_name = prop.attrib.get("name")
+        if prop_name:
+            properties_docs[prop_name] = _get_first_doc_text(prop)
+
+    # 3. Parse Instance Methods (core:method)
+    methods_docs: dict[str, GirFunctionDocs] = {}
+    for method in container.iterchildren(_METHOD_TAG):
+        method_name = method.attrib.get("name")
+        if method_name:
+            methods_docs[method_name] = _extract_function_docs(method)
+
+    # 4. Parse Static Methods (core:function inside the class)
+    static_methods_docs: dict[str, GirFunctionDocs] = {}
+    for func in container.iterchildren(_FUNCTION_TAG):
+        func_name = func.attrib.get("name")
+        if func_name:
+            static_methods_docs[func_name] = _extract_function_docs(func)
+
+    # 5. Parse Constructors (core:constructor)
+    constructors_docs: dict[str, GirFunctionDocs] = {}
+    for ctor in container.iterchildren(_CONSTRUCTOR_TAG):
+        ctor_name = ctor.attrib.get("name")
+        if ctor_name:
+            constructors_docs[ctor_name] = _extract_function_docs(ctor)
+
+    # 6. Parse Signals (glib:signal)
+    # Note: Signals use the 'glib' namespace, not 'core'
+    signals_docs: dict[str, GirFunctionDocs] = {}
+    for signal in container.iterchildren(_SIGNAL_TAG):
+        sig_name = signal.attrib.get("name")
+        if sig_name:
+            signals_docs[sig_name] = _extract_function_docs(signal)
+
+    return GirClassDocs(
+        class_docstring=class_docstring,
+        fields=fields_docs,
+        methods={**methods_docs, **static_methods_docs, **constructors_docs},
+        signals=signals_docs,
+        properties=properties_docs,
+    )
 
 
 def parse_gir_docs(path: Path) -> ModuleDocs | None:
     """
     Main entry point to parse a GIR file and extract all documentation.
+    The file is streamed in a single pass: each namespace level element
+    is parsed as soon as it is complete and then dropped, so the whole
+    document is never kept in memory.
     """
     if not path.exists():
         logger.warning(f"Path {path} does not exist, not parsing.")
@@ -245,27 +238,47 @@ def parse_gir_docs(path: Path) -> ModuleDocs | None:
 
     gir_namespace = path.stem.split("-")[0]  # e.g., "Gst" from "Gst-1.0.gir"
 
-    root = etree.parse(path, parser=etree.XMLParser(recover=True))
-
-    ns = {
-        "core": "http://www.gtk.org/introspection/core/1.0",
-        "c": "http://www.gtk.org/introspection/c/1.0",
-        "glib": "http://www.gtk.org/introspection/glib/1.0",
-    }
-
-    # Parse different sections of the GIR file
-    constant_docs = parse_constants("core:namespace/core:constant", root, ns)
-    function_docs = parse_global_functions("core:namespace/core:function", root, ns)
-
-    # Parse Enums and Bitfields (simple key-value members)
-    bitfield_docs = _parse_simple_container("core:namespace/core:bitfield", root, ns, "core:member")
-    enumeration_docs = _parse_simple_container("core:namespace/core:enumeration", root, ns, "core:member")
-
-    # Parse Classes, Records, and Interfaces (complex structures)
+    constant_docs: dict[str, str] = {}
+    function_docs: dict[str, GirFunctionDocs] = {}
+    # Enums and Bitfields (simple key-value members)
+    bitfield_docs: dict[str, GirClassDocs] = {}
+    enumeration_docs: dict[str, GirClassDocs] = {}
+    # Classes, Records, and Interfaces (complex structures)
     # Note: Records (structs) and Interfaces share a similar structure to Classes in GIR
-    class_docs = parse_classes("core:namespace/core:class", root, ns)
-    record_docs = parse_classes("core:namespace/core:record", root, ns)
-    interface_docs = parse_classes("core:namespace/core:interface", root, ns)
+    class_docs: dict[str, GirClassDocs] = {}
+    record_docs: dict[str, GirClassDocs] = {}
+    interface_docs: dict[str, GirClassDocs] = {}
+
+    context = etree.iterparse(str(path), events=("end",), tag=_TOP_LEVEL_TAGS, recover=True)
+    for _, element in context:
+        parent = element.getparent()
+        if parent is None or parent.tag != _NAMESPACE_TAG:
+            # nested element (i.e. a static method <function> inside a <class>)
+            # it is parsed together with its container
+            continue
+
+        name = element.attrib.get("name")
+        if name:
+            tag = element.tag
+            if tag == _CONSTANT_TAG:
+                constant_docs[name] = _get_first_doc_text(element)
+            elif tag == _FUNCTION_TAG:
+                function_docs[name] = _extract_function_docs(element)
+            elif tag == _BITFIELD_TAG:
+                bitfield_docs[name] = _parse_simple_container(element, _MEMBER_TAG)
+            elif tag == _ENUMERATION_TAG:
+                enumeration_docs[name] = _parse_simple_container(element, _MEMBER_TAG)
+            elif tag == _CLASS_TAG:
+                class_docs[name] = parse_class(element)
+            elif tag == _RECORD_TAG:
+                record_docs[name] = parse_class(element)
+            else:
+                interface_docs[name] = parse_class(element)
+
+        # free the parsed element and every already processed sibling before it
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del parent[0]
 
     # Combine all complex types into the 'classes' dictionary
     all_classes = {**class_docs, **record_docs, **interface_docs}
@@ -104,6 +104,9 @@ def parse_module(
     from gi_stub_gen.schema.alias import AliasSchema
     from gi_stub_gen.schema.class_ import ClassSchema
 
+    # singleton: fetched once instead of once per constant/function
+    gir_docs = GIRDocs()
+
     with Progress(
         *progress_columns,
         console=logging_console,
@@ -152,7 +155,7 @@ def parse_module(
                 module_name=module_name,
                 name=attribute_name,
                 obj=attribute,
-                docstring=GIRDocs().get_constant_docs(attribute_name),
+                docstring=gir_docs.get_constant_docs(attribute_name),
             ):
                 module_constants.append(c)
                 # logger.debug(f"\t[CONSTANT] {attribute_name}\n")
@@ -180,14 +183,19 @@ def parse_module(
                 raise NotImplementedError("VFuncInfo not implemented, open an issue?")
 
             # docstring.get(attribute.get_name(), None)
-            if f := parse_function(
-                attribute,
-                docstring=GIRDocs().get_function_docstring(attribute_name),
+            # parse_function only accepts GI.FunctionInfo: check it first so the
+            # docstring is not looked up (and translated) for every other attribute
+            if isinstance(attribute, GI.FunctionInfo) and (
+                f := parse_function(
+                    attribute,
+                    docstring=gir_docs.get_function_docstring(attribute_name),
+                )
             ):
                 module_functions.append(f)
                 # callbacks can be found as arguments of functions,
-                # save them to be parsed later
-                callbacks_found.extend(f._gi_callbacks)
+                # save them to be parsed later (most functions have none)
+                if function_callbacks := f._gi_callbacks:
+                    callbacks_found.extend(function_callbacks)
                 continue
 
             #########################################################################
@@ -205,6 +213,10 @@ def parse_module(
             #########################################################################
             # check if the attribute is a class (GObjectMeta, StructMeta and type)
             #########################################################################
+            # NOTE: classes are parsed serially on purpose. GI infos can not be pickled
+            # and parse_class relies on per-process state (GIRDocs loaded by the cli,
+            # GIRepo, imported typelibs), so a process pool would have to redo all of it
+            # in every worker.
             class_schema, class_callbacks_found = parse_class(
                 module_name=module_name,
                 class_to_parse=attribute,
@@ -231,9 +243,12 @@ def parse_module(
     # add override callbacks
     from gi_stub_gen.overrides import CALLBACK_OVERRIDES
 
+    # names collected once, not rebuilt as a list for every override
+    found_callback_names = {cb.name for cb in callbacks_found}
     for override in CALLBACK_OVERRIDES.get(module_name, {}).values():
-        if override.name not in [cb.name for cb in callbacks_found]:
+        if override.name not in found_callback_names:
             callbacks_found.append(override)
+            found_callback_names.add(override.name)
 
     # just filter only the callbacks used in the module
     module_callbacks: dict[str, CallbackSchema] = {}
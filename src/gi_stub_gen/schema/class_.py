@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 
+from dataclasses import dataclass
 from typing import Any
 from gi_stub_gen.manager.gir_docs import GIRDocs
 from gi_stub_gen.schema.builtin_function import BuiltinFunctionSchema
@@ -17,10 +18,14 @@ from gi_stub_gen.utils.utils import get_super_class_name, sanitize_gi_module_nam
 logger = logging.getLogger(__name__)
 
 
-class ClassPropSchema(BaseSchema):
+@dataclass(frozen=True, slots=True)
+class ClassPropSchema:
     """
     Represents a property of a GI class.
     These are available in a <class>.props.<property_name> fashion.
+
+    Plain frozen dataclass instead of a BaseSchema: these are write-once records
+    built in bulk, so we skip pydantic validation and the per-instance __dict__.
     """
 
     name: str
@@ -66,10 +71,14 @@ class ClassPropSchema(BaseSchema):
         return hint
 
 
-class ClassFieldSchema(BaseSchema):
+@dataclass(frozen=True, slots=True)
+class ClassFieldSchema:
     """
     Represents a field of a GI class.
-    These are present in boxed structs
+    These are present in boxed structs.
+
+    Frozen dataclass like ClassPropSchema, it is still serialized
+    by pydantic when nested in ClassSchema (e.g. for debug output).
     """
 
     name: str
@@ -192,23 +201,17 @@ class ClassSchema(BaseSchema):
         builtin_methods: list[BuiltinFunctionSchema],
         extra: list[str],
     ):
-        gi_info = None
-        if hasattr(obj, "__info__"):
-            gi_info = obj.__info__
+        gi_info = getattr(obj, "__info__", None)
 
         is_deprecated = gi_info.is_deprecated() if gi_info else False
 
         ## WIP DEBUGGING PURPOSES
-        try:
-            extra.extend(
-                [
-                    f"mro={obj.__mro__}",
-                    # f"mro={obj.mro()}",
-                    f"self={obj.__module__}.{obj.__name__}",
-                ]
-            )
-        except Exception:
-            breakpoint()
+        extra.extend(
+            [
+                f"mro={obj.__mro__}",
+                f"self={obj.__module__}.{obj.__name__}",
+            ]
+        )
         ## END WIP DEBUGGING PURPOSES
 
         class_docstring = GIRDocs().get_class_docstring(obj.__name__)
@@ -250,7 +253,9 @@ class ClassSchema(BaseSchema):
             if sane_super_namespace != sanitize_gi_module_name(namespace):
                 required_gi_import = sane_super_namespace
 
-        instance = cls(
+        # all the members have just been built by the parser:
+        # skip pydantic validation (and the copy of every nested schema)
+        instance = cls.model_construct(
             namespace=namespace,
             name=obj.__name__,
             bases=[base_class],
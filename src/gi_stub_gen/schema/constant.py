@@ -4,7 +4,7 @@ from __future__ import annotations
 import enum
 import logging
 
-from gi_stub_gen.utils.gi_utils import get_gi_module_from_name
+from gi_stub_gen.utils.gi_utils import get_gi_interface_py_type
 from gi_stub_gen.manager.template import TemplateManager
 from gi_stub_gen.schema import BaseSchema
 from gi_stub_gen.schema.utils import ValueAny
@@ -96,9 +96,12 @@ class VariableSchema(BaseSchema):
         sanitized_namespace = sanitize_gi_module_name(namespace)
         object_type = type(obj)
         object_type_namespace: str | None = None
-        if hasattr(obj, "__info__"):
-            if obj.__info__.get_namespace() != sanitized_namespace:
-                object_type_namespace = str(obj.__info__.get_namespace())
+        # GI info of enum/flags values, looked up once
+        gi_info = getattr(obj, "__info__", None)
+        if gi_info is not None:
+            gi_namespace = gi_info.get_namespace()
+            if gi_namespace != sanitized_namespace:
+                object_type_namespace = str(gi_namespace)
 
         # type representation in template should include namespace only if
         # it is different from the current namespace
@@ -126,14 +129,14 @@ class VariableSchema(BaseSchema):
                 # value_repr = "..."
                 object_type_repr = get_type_hint(obj)
 
-        elif hasattr(obj, "__info__"):
-            if hasattr(obj.__info__, "is_deprecated"):
-                is_deprecated = obj.__info__.is_deprecated()
+        elif gi_info is not None:
+            if hasattr(gi_info, "is_deprecated"):
+                is_deprecated = gi_info.is_deprecated()
 
             # value is from gi: can be an enum or flags
             # both are GI.EnumInfo
-            if type(obj.__info__) is GI.EnumInfo:
-                is_flags = obj.__info__.is_flags()
+            if type(gi_info) is GI.EnumInfo:
+                is_flags = gi_info.is_flags()
                 is_enum_or_flags = True
 
                 if is_flags:
@@ -159,8 +162,7 @@ class VariableSchema(BaseSchema):
                         # so first_value_nick is not present
                         try:
                             # try to get the flag name instantiating the enum class
-                            module = get_gi_module_from_name(f"gi.repository.{str(obj.__info__.get_namespace())}", None)
-                            enum_class = getattr(module, object_type.__name__)
+                            enum_class = get_gi_interface_py_type(str(gi_info.get_namespace()), object_type.__name__)
 
                             flags_field_name = enum_class(obj.real).name
                             if flags_field_name is not None:
@@ -188,8 +190,7 @@ class VariableSchema(BaseSchema):
                         # so value_nick is not present
                         try:
                             # try to get the value name instantiating the enum class
-                            module = get_gi_module_from_name(f"gi.repository.{str(obj.__info__.get_namespace())}", None)
-                            enum_class = getattr(module, object_type.__name__)
+                            enum_class = get_gi_interface_py_type(str(gi_info.get_namespace()), object_type.__name__)
                             enum_field_name = enum_class(obj.value).name
 
                             if enum_field_name is not None:
@@ -38,6 +38,7 @@ class EnumFieldSchema(BaseSchema):
         value_info: GI.ValueInfo,  # GIRepository.ValueInfo but missing the functions addedd by pygobject
         docstring: str | None,
         deprecation_warnings: str | None,
+        name: str | None = None,  # value_info.get_name(), if already fetched by the caller
     ):
         # TODO:
         # value_info.get_name() != value_info.get_name_unescaped()
@@ -48,15 +49,16 @@ class EnumFieldSchema(BaseSchema):
         # NOW IT IS DONE DIRECTLY BY THE GI TOOLKIT
         # KEEPING THIS CODE FOR FUTURE REFERENCE
 
-        field_name = value_info.get_name()
-        line_comment = None
-        if value_info.get_name_unescaped() != value_info.get_name():
+        if name is None:
+            name = value_info.get_name()
+        name_unescaped = value_info.get_name_unescaped()
+        if name_unescaped != name:
             # GLib.IOCondition.IN has get_name_unescaped "in" and get_name "in_"
             # In this case escaping "in" to "in_" should not be done
             # because even if they are keywords they are valid as class fields
             # we just check again if there are other issues with the name
             field_name, line_comment = sanitize_variable_name(
-                value_info.get_name_unescaped(),
+                name_unescaped,
                 keyword_check=False,
             )
             # if value_info.get_name_unescaped() == "in":
@@ -70,14 +72,15 @@ class EnumFieldSchema(BaseSchema):
             # so we add a generic sanitization step
             # keyword are fine as class fields
             field_name, line_comment = sanitize_variable_name(
-                value_info.get_name(),
+                name,
                 keyword_check=False,
             )
 
+        value = value_info.get_value()
         return cls(
             name=field_name.upper(),
-            value=value_info.get_value(),
-            value_repr=repr(value_info.get_value()),
+            value=value,
+            value_repr=repr(value),
             is_deprecated=value_info.is_deprecated(),
             docstring=docstring,
             deprecation_warnings=deprecation_warnings,
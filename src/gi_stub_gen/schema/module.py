@@ -73,8 +73,7 @@ class ModuleSchema(BaseSchema):
         #     gi_imports.add("GObject")
 
         # remove current module name from imports
-        if self.name.removeprefix("gi.repository.") in gi_imports:
-            gi_imports.remove(self.name.removeprefix("gi.repository."))
+        gi_imports.discard(self.name.removeprefix("gi.repository."))
 
         if extra_imports:
             for extra_import in extra_imports:
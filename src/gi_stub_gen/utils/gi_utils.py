@@ -1,3 +1,4 @@
+import functools
 import importlib
 from typing import Any
 import gi
@@ -49,6 +50,11 @@ map_gi_tag_to_type = {
     GI.TypeTag.ERROR: GLib.Error,  # 20
     GI.TypeTag.GTYPE: GObject.GType,  # 12 use string? the resolved type has lowercase gobject
 }
+
+# resolved once: compared against the tag of every converted type
+_TAG_INTERFACE = GI.TypeTag.INTERFACE
+_TAG_VOID = GI.TypeTag.VOID
+
 # same map but for gtype
 MAP_GI_GTYPE_TO_TYPE = {
     GObject.TYPE_BOOLEAN: bool,
@@ -161,12 +167,13 @@ def get_gi_type_info(
     Handles the discrepancy between PyGObject versions (get_type vs get_type_info).
     """
 
+    # a single getattr per accessor (None if missing) instead of hasattr + attribute access
     # was present in 3.50.0 ??
-    if hasattr(obj, "get_type"):
-        return obj.get_type()
+    if get_type := getattr(obj, "get_type", None):
+        return get_type()
 
-    if hasattr(obj, "get_type_info"):
-        return obj.get_type_info()
+    if get_type_info := getattr(obj, "get_type_info", None):
+        return get_type_info()
 
     # if it is already a TypeInfo, return it
     if isinstance(obj, GI.TypeInfo):  # type: ignore
@@ -186,11 +193,34 @@ def gi_type_is_callback(gi_type_info: GI.TypeInfo) -> bool:
         bool: True if the type is a callback
 
     """
-    return gi_type_info.get_tag() == GI.TypeTag.INTERFACE and isinstance(
+    return gi_type_info.get_tag() == _TAG_INTERFACE and isinstance(
         gi_type_info.get_interface(), (GI.CallbackInfo, GIRepository.CallbackInfo)
     )
 
 
+@functools.lru_cache(maxsize=None)
+def get_gi_interface_py_type(
+    namespace: str,
+    name: str,
+) -> Any:
+    """
+    Resolve the python type of a GI interface (object/struct/enum...) from
+    its namespace and name, i.e. gi.repository.<namespace>.<name>.
+
+    GI TypeInfo objects are not reliable cache keys, so we memoize on the
+    (namespace, name) pair instead: the same interfaces recur across the
+    fields/properties/arguments of the whole module.
+
+    Args:
+        namespace (str): namespace of the interface, e.g. "Gst"
+        name (str): name of the interface, e.g. "Element"
+
+    Returns:
+        python type object
+    """
+    return getattr(importlib.import_module(f"gi.repository.{namespace}"), name)
+
+
 # GObject.ClosureMarshal
 def gi_type_to_py_type(
     gi_type_info: GI.TypeInfo,
@@ -215,7 +245,7 @@ def gi_type_to_py_type(
     # if py_type is None and tag_as_string == "void":
     #     return object
     # if py_type is None and tag_as_string == "interface":
-    if py_type is None and tag == GI.TypeTag.INTERFACE:
+    if py_type is None and tag == _TAG_INTERFACE:
         # TODO: return parse_struct_info_schema
         # with namespace
         iface = gi_type_info.get_interface()
@@ -227,7 +257,6 @@ def gi_type_to_py_type(
         if isinstance(iface, (GI.CallbackInfo, GIRepository.CallbackInfo)):
             # cant return the type, will not work since
             # a callback is not implemented in python
-            breakpoint()
             raise NotImplementedError(f"CallbackInfo to Python type conversion not possible, found {type(iface)}")
             # return gi_callback_to_py_type(iface)
             # cant return the type, will not work since it is not implemented
@@ -254,9 +283,9 @@ def gi_type_to_py_type(
         # return ns.iface_name
         # return f"{ns}.{iface_name}"
 
-        return getattr(importlib.import_module(f"gi.repository.{ns}"), iface_name)
+        return get_gi_interface_py_type(ns, iface_name)
 
-    if py_type is None and tag == GI.TypeTag.VOID:
+    if py_type is None and tag == _TAG_VOID:
         # TODO: how to handle void?
         # in Gst.is_caps_features.get_arguments()[0].get_type() it is an object
         # in Gst.init.get_return_type().get_tag_as_string() it is None ??
@@ -389,6 +418,45 @@ def catch_gi_deprecation_warnings(
     return attribute_deprecation_warnings
 
 
+# tag sets used by is_class_field_nullable (called for every field/property),
+# built once at import instead of on every call
+
+# primitives are non-nullable
+_NON_NULLABLE_TAGS = frozenset(
+    {
+        GIRepository.TypeTag.BOOLEAN,
+        GIRepository.TypeTag.INT8,
+        GIRepository.TypeTag.INT16,
+        GIRepository.TypeTag.INT32,
+        GIRepository.TypeTag.INT64,
+        GIRepository.TypeTag.UINT8,
+        GIRepository.TypeTag.UINT16,
+        GIRepository.TypeTag.UINT32,
+        GIRepository.TypeTag.UINT64,
+        GIRepository.TypeTag.FLOAT,
+        GIRepository.TypeTag.DOUBLE,
+        GIRepository.TypeTag.GTYPE,
+        GIRepository.TypeTag.UTF8,  # string: can be NULL in c but dont think so in python
+        GIRepository.TypeTag.UNICHAR,  # string: can be NULL in c but dont think so in python
+        GIRepository.TypeTag.FILENAME,  # string: can be NULL in c but dont think so in python
+    }
+)
+
+# lists and maps (Array, List, Hash)
+_CONTAINER_TAGS = frozenset(
+    {
+        GIRepository.TypeTag.ARRAY,
+        GIRepository.TypeTag.GLIST,
+        GIRepository.TypeTag.GSLIST,
+        GIRepository.TypeTag.GHASH,
+    }
+)
+
+# tags compared one by one after the set lookups above
+_GIREPOSITORY_TAG_INTERFACE = GIRepository.TypeTag.INTERFACE
+_GIREPOSITORY_TAG_VOID = GIRepository.TypeTag.VOID
+
+
 def is_class_field_nullable(field_info) -> bool:
     """
     Determine if a struct field can be None.
@@ -408,38 +476,15 @@ def is_class_field_nullable(field_info) -> bool:
     # GI.TypeTag.ERROR: None,  # 20
 
     # primitives are non-nullable
-    NON_NULLABLE_TAGS = {
-        GIRepository.TypeTag.BOOLEAN,
-        GIRepository.TypeTag.INT8,
-        GIRepository.TypeTag.INT16,
-        GIRepository.TypeTag.INT32,
-        GIRepository.TypeTag.INT64,
-        GIRepository.TypeTag.UINT8,
-        GIRepository.TypeTag.UINT16,
-        GIRepository.TypeTag.UINT32,
-        GIRepository.TypeTag.UINT64,
-        GIRepository.TypeTag.FLOAT,
-        GIRepository.TypeTag.DOUBLE,
-        GIRepository.TypeTag.GTYPE,
-        GIRepository.TypeTag.UTF8,  # string: can be NULL in c but dont think so in python
-        GIRepository.TypeTag.UNICHAR,  # string: can be NULL in c but dont think so in python
-        GIRepository.TypeTag.FILENAME,  # string: can be NULL in c but dont think so in python
-    }
-
-    if tag in NON_NULLABLE_TAGS:
+    if tag in _NON_NULLABLE_TAGS:
         return False
 
     # lists and maps (Array, List, Hash)
     # pointer to structures, can be NULL
-    if tag in {
-        GIRepository.TypeTag.ARRAY,
-        GIRepository.TypeTag.GLIST,
-        GIRepository.TypeTag.GSLIST,
-        GIRepository.TypeTag.GHASH,
-    }:
+    if tag in _CONTAINER_TAGS:
         return True
 
-    if tag == GIRepository.TypeTag.INTERFACE:  # function/callback/struct
+    if tag == _GIREPOSITORY_TAG_INTERFACE:  # function/callback/struct
         # we need to check if it is a struct or callback
         iface = type_info.get_interface()
         # we check the class name instead of checking
@@ -451,7 +496,7 @@ def is_class_field_nullable(field_info) -> bool:
         # structs and callbacks can be nullable
         return True
 
-    if tag == GIRepository.TypeTag.VOID:  # can be a pointer to an object or None
+    if tag == _GIREPOSITORY_TAG_VOID:  # can be a pointer to an object or None
         return True
 
     if type_info.is_pointer():
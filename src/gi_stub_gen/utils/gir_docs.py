@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import re
 import logging
+from typing import Callable
 
 from gi_stub_gen.manager.gi_repo import GIRepo
 from gi.repository import GIRepository
@@ -9,43 +11,42 @@ from gi.repository import GIRepository
 
 logger = logging.getLogger(__name__)
 
+# patterns compiled once, translate_docstring runs for every documented GIR element
+_C_VALUE_RE = re.compile(r"\b(NULL|TRUE|FALSE)\b")
+_C_VALUE_TO_PY = {"NULL": "None", "TRUE": "True", "FALSE": "False"}
+_PARAM_RE = re.compile(r"@(\w+)")
+_CLASS_REF_RE = re.compile(r"#([A-Z][a-zA-Z0-9]+)")
+_CONSTANT_RE = re.compile(r"%([A-Z0-9_]+)")
+_FUNC_CALL_RE = re.compile(r"\b(\w+)\(\)")
+_ORPHAN_BACKSLASH_RE = re.compile(r"\\(?=[^a-zA-Z0-9\\])")
 
-def translate_docstring(
-    raw_text: str | None,
+# translate_docstring only changes text containing at least one of these
+# (xml entities, C values, @param, #Class, %CONSTANT, func(), backslashes, triple quotes):
+# plain prose docstrings, the vast majority, are only stripped
+_TRANSLATION_MARKERS = ("&", "NULL", "TRUE", "FALSE", "@", "#", "%", "()", "\\", '"""')
+
+
+def _replace_c_value(match: re.Match) -> str:
+    return _C_VALUE_TO_PY[match.group(1)]
+
+
+@functools.lru_cache(maxsize=32)
+def _get_namespace_replacers(
     namespace: str,
-    repo: GIRepo | None = None,
-) -> str:
+    repo: GIRepo | None,
+) -> tuple[Callable[[re.Match], str], Callable[[re.Match], str], Callable[[re.Match], str]]:
     """
-    Complete pipeline for processing docstrings:
-    1. Semantic translation from C/GObject conventions to Python (e.g., NULL -> None).
-    2. Syntactic sanitization to ensure valid Python syntax in .pyi files.
+    Build the namespace dependent substitution callbacks used by translate_docstring.
+    They only depend on the namespace (and repo), so they are created once per namespace
+    instead of once per translated docstring.
 
     Args:
-        raw_text: The raw documentation string extracted from the GIR/XML.
         namespace: The current namespace (e.g., "Gst", "GLib") used to resolve references.
-        repo: Optional GIRepo instance for looking up class/function info. NOTE: requires the namespace to be loaded. (use GIRepo.require(namespace, version), beforehand)
+        repo: Optional GIRepo instance for looking up class/function info.
 
     Returns:
-        A cleaned, Python-friendly docstring ready to be written to the stub file.
+        The class reference, constant and function call replacement callbacks.
     """
-    if not raw_text:
-        return ""
-
-    # --- PHASE 1: Semantic Translation (C -> Python) ---
-    # We modify the content to look "Pythonic" before escaping special characters.
-
-    # 1. Decode common XML entities (since lxml might leave some encoded)
-    text = raw_text.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
-
-    # 2. Translate fundamental values
-    # Use word boundaries (\b) to avoid replacing substrings (e.g., ANULL -> ANone is wrong)
-    text = re.sub(r"\bNULL\b", "None", text)
-    text = re.sub(r"\bTRUE\b", "True", text)
-    text = re.sub(r"\bFALSE\b", "False", text)
-
-    # 3. Parameters: Convert @param_name to `param_name`
-    # C conventions use @ for parameters; Python usually uses backticks.
-    text = re.sub(r"@(\w+)", r"`\1`", text)
 
     # 4. Class References: Convert #GstBin to Gst.Bin or Bin
     # The pattern matches #NamespaceClass.
@@ -61,8 +62,6 @@ def translate_docstring(
         # If it belongs to another namespace, keep the full name or add logic here
         return full_name
 
-    text = re.sub(r"#([A-Z][a-zA-Z0-9]+)", replace_class_ref, text)
-
     # 5. Constants: Convert %GST_STATE_PLAYING to Gst.State.PLAYING
     # Heuristic: If it starts with the uppercase Namespace, allow pythonizing it.
     ns_upper = namespace.upper() + "_"
@@ -77,8 +76,6 @@ def translate_docstring(
             return f"{namespace}.{const_name[len(ns_upper) :]}"
         return const_name
 
-    text = re.sub(r"%([A-Z0-9_]+)", replace_constant, text)
-
     # 6. Functions: Convert gst_bus_post() -> `Gst.Bus.post`
     # We attempt to detect if the function belongs to a specific Class/Struct
     # by querying the GIRepository.
@@ -137,7 +134,59 @@ def translate_docstring(
         # Result: `Gst.init`
         return f"`{namespace}.{suffix}`"
 
-    text = re.sub(r"\b(\w+)\(\)", replace_func_call, text)
+    return replace_class_ref, replace_constant, replace_func_call
+
+
+def translate_docstring(
+    raw_text: str | None,
+    namespace: str,
+    repo: GIRepo | None = None,
+) -> str:
+    """
+    Complete pipeline for processing docstrings:
+    1. Semantic translation from C/GObject conventions to Python (e.g., NULL -> None).
+    2. Syntactic sanitization to ensure valid Python syntax in .pyi files.
+
+    Args:
+        raw_text: The raw documentation string extracted from the GIR/XML.
+        namespace: The current namespace (e.g., "Gst", "GLib") used to resolve references.
+        repo: Optional GIRepo instance for looking up class/function info. NOTE: requires the namespace to be loaded. (use GIRepo.require(namespace, version), beforehand)
+
+    Returns:
+        A cleaned, Python-friendly docstring ready to be written to the stub file.
+    """
+    if not raw_text:
+        return ""
+
+    if not any(marker in raw_text for marker in _TRANSLATION_MARKERS):
+        return raw_text.strip()
+
+    # --- PHASE 1: Semantic Translation (C -> Python) ---
+    # We modify the content to look "Pythonic" before escaping special characters.
+
+    # 1. Decode common XML entities (since lxml might leave some encoded)
+    text = raw_text.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
+
+    # 2. Translate fundamental values
+    # Use word boundaries (\b) to avoid replacing substrings (e.g., ANULL -> ANone is wrong)
+    # NULL, TRUE and FALSE are all replaced in a single pass
+    text = _C_VALUE_RE.sub(_replace_c_value, text)
+
+    # 3. Parameters: Convert @param_name to `param_name`
+    # C conventions use @ for parameters; Python usually uses backticks.
+    text = _PARAM_RE.sub(r"`\1`", text)
+
+    # namespace dependent substitutions (see _get_namespace_replacers)
+    replace_class_ref, replace_constant, replace_func_call = _get_namespace_replacers(namespace, repo)
+
+    # 4. Class References: Convert #GstBin to Gst.Bin or Bin
+    text = _CLASS_REF_RE.sub(replace_class_ref, text)
+
+    # 5. Constants: Convert %GST_STATE_PLAYING to Gst.State.PLAYING
+    text = _CONSTANT_RE.sub(replace_constant, text)
+
+    # 6. Functions: Convert gst_bus_post() -> `Gst.Bus.post`
+    text = _FUNC_CALL_RE.sub(replace_func_call, text)
 
     # --- PHASE 2: Syntactic Sanitization ---
     # Now we ensure the string doesn't break the Python file syntax.
@@ -145,7 +194,7 @@ def translate_docstring(
     # 7. Remove "orphan" backslashes
     # Finds a backslash NOT followed by a letter, number, or another backslash.
     # This cleans up typos in C docs like "function\()" -> "function()".
-    text = re.sub(r"\\(?=[^a-zA-Z0-9\\])", "", text)
+    text = _ORPHAN_BACKSLASH_RE.sub("", text)
 
     # 8. Escape backslashes
     # We double the backslashes to ensure they are treated as literal characters
@@ -171,7 +220,7 @@ def make_safe_docstring(text: str | None) -> str:
     # Transform "function\()" -> "function()"
     # Transform "set_\*"    -> "set_*"
     # Ignore    "C:\User"
-    text = re.sub(r"\\(?=[^a-zA-Z0-9\\])", "", text)
+    text = _ORPHAN_BACKSLASH_RE.sub("", text)
 
     # "C:\user" -> "C:\\user"
     text = text.replace("\\", "\\\\")
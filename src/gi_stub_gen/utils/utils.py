@@ -1,6 +1,8 @@
+import sys
 import typing
 import keyword
 import logging
+import functools
 
 import re
 
@@ -125,15 +127,18 @@ def get_super_class_name(
     return super_module, super_class.__name__
 
 
+@functools.lru_cache(maxsize=None)
 def get_py_type_namespace_repr(py_type: Any) -> str | None:
     """
-    Get the namespace repr of a python type or object
+    Get the namespace repr of a python type or object.
+    Results are memoized since the same types recur across the whole module,
+    and interned so that all the schemas share one string per namespace.
     """
 
     # if the type has a __info__ attribute, it is a GObject type
     # and we can get the namespace from it
     if hasattr(py_type, "__info__"):
-        return f"{py_type.__info__.get_namespace()}"  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+        return sys.intern(f"{py_type.__info__.get_namespace()}")  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
 
     # py_type.__module__
 
@@ -165,14 +170,16 @@ def get_py_type_namespace_repr(py_type: Any) -> str | None:
                 except (ImportError, AttributeError):
                     pass
 
-        return name
+        return sys.intern(name)
 
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def get_py_type_name_repr(py_type: Any) -> str:
     """
-    Get the string representation of a python type or object
+    Get the string representation of a python type or object.
+    Results are memoized since the same types recur across the whole module.
     """
     # if it is a GObject
     if hasattr(py_type, "__info__"):
@@ -206,6 +213,15 @@ def sanitize_gi_module_name(module_name: str) -> str:
     """
     if not isinstance(module_name, str):
         raise ValueError("module_name must be a string")
+    return _sanitize_gi_module_name(module_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _sanitize_gi_module_name(module_name: str) -> str:
+    """
+    Memoized implementation of sanitize_gi_module_name.
+    It is called with the same few namespaces for every rendered type hint.
+    """
     return (
         str(module_name)
         .removeprefix("gi.repository.")
@@ -216,6 +232,19 @@ def sanitize_gi_module_name(module_name: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=None)
+def get_module_name_last_part(module_name: str) -> str:
+    """
+    Get the last part of a module name, lowercased.
+    Memoized since it is computed for every class of a module
+    (and class modules are few and repeat a lot).
+
+    e.g. "gi.repository.Gio" -> "gio", "gi.overrides.Gio" -> "gio"
+    """
+    # rpartition returns the tail without building the list of all the parts
+    return module_name.rpartition(".")[2].lower()
+
+
 def sanitize_variable_name(
     name: str,
     keyword_check=True,
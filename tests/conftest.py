@@ -34,6 +34,22 @@ FAKE_GIR_CONTENT = """<?xml version="1.0"?>
       <type name="gint" c:type="gint"/>
     </constant>
 
+    <enumeration name="Color" c:type="TestColor">
+      <doc xml:space="preserve" filename="test.c" line="25">A color.</doc>
+      <member name="red" value="0" c:identifier="TEST_COLOR_RED">
+        <doc xml:space="preserve" filename="test.c" line="26">The red color.</doc>
+      </member>
+      <member name="green" value="1" c:identifier="TEST_COLOR_GREEN"/>
+    </enumeration>
+
+    <record name="Point" c:type="TestPoint">
+      <doc xml:space="preserve" filename="test.c" line="30">A point.</doc>
+      <field name="x" writable="1">
+        <doc xml:space="preserve" filename="test.c" line="31">The x coordinate.</doc>
+        <type name="gint" c:type="gint"/>
+      </field>
+    </record>
+
   </namespace>
 </repository>
 """
@@ -45,6 +45,29 @@ def test_get_constant_docstring(fake_gir_file):
     assert doc == "A magic number."
 
 
+def test_get_class_fields_docs(fake_gir_file):
+    # nothing loaded yet
+    assert GIRDocs().get_class_fields_docs("Point") == {}
+
+    GIRDocs().load(fake_gir_file)
+
+    assert GIRDocs().get_class_fields_docs("Point") == {"x": "The x coordinate."}
+    assert GIRDocs().get_class_fields_docs("Missing") == {}
+    assert GIRDocs().get_class_field_docstring("Point", "x") == "The x coordinate."
+
+
+def test_get_enum_fields_docs(fake_gir_file):
+    # nothing loaded yet
+    assert GIRDocs().get_enum_fields_docs("Color") == {}
+
+    GIRDocs().load(fake_gir_file)
+
+    # undocumented members are kept with an empty docstring
+    assert GIRDocs().get_enum_fields_docs("Color") == {"red": "The red color.", "green": ""}
+    assert GIRDocs().get_enum_fields_docs("Missing") == {}
+    assert GIRDocs().get_enum_field_docstring("Color", "red") == "The red color."
+
+
 def test_reset_works(fake_gir_file):
     GIRDocs().load(fake_gir_file)
     assert GIRDocs().get_function_docstring("hello_world") is not None
@@ -56,6 +79,20 @@ def test_reset_works(fake_gir_file):
     assert GIRDocs().get_function_docstring("hello_world") is None
 
 
+def test_translated_docstring_is_cached(fake_gir_file):
+    docs = GIRDocs()
+    docs.load(fake_gir_file)
+
+    first = docs.get_function_docstring("hello_world")
+    assert docs._translated_docs == {"Prints hello to stdout.": first}
+    # second lookup is served from the cache
+    assert docs.get_function_docstring("hello_world") is first
+
+    # loading a new file drops the cached translations
+    docs.load(fake_gir_file)
+    assert docs._translated_docs == {}
+
+
 def test_translate_c_to_py_docstring_complex_scenario():
     namespace = "Gst"
 
@@ -96,6 +133,10 @@ def test_empty_docstring():
     assert translate_docstring("", "Gst") == ""
 
 
+def test_plain_docstring_is_only_stripped():
+    assert translate_docstring("  Plain prose (no markers).\n", "Gst") == "Plain prose (no markers)."
+
+
 def test_translate_docstring_smart_class_resolution():
     """
     Tests the heuristic logic that converts C function calls (snake_case)
@@ -31,3 +31,28 @@ def test_expected_failure_on_empty_name():
 
     with pytest.raises(ValueError):
         sane_variable, comment = sanitize_variable_name(None)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "module_name,expected",
+    [
+        ("gi.repository.Gst", "Gst"),
+        ("gi.overrides.Gio", "Gio"),
+        ("gi.repository.gobject", "GObject"),
+        ("glib", "GLib"),
+    ],
+)
+def test_sanitize_gi_module_name(module_name: str, expected: str):
+    from gi_stub_gen.utils.utils import sanitize_gi_module_name
+
+    # called twice to also go through the memoized path
+    assert sanitize_gi_module_name(module_name) == expected
+    assert sanitize_gi_module_name(module_name) == expected
+
+
+def test_sanitize_gi_module_name_not_a_string():
+    from gi_stub_gen.utils.utils import sanitize_gi_module_name
+
+    # unhashable input must still raise ValueError, not the cache TypeError
+    with pytest.raises(ValueError):
+        sanitize_gi_module_name(["gi.repository.Gst"])  # type: ignore